@@ -1,9 +1,12 @@
 """Streamlit demo application"""
 import streamlit as st
 import requests
+from requests.adapters import HTTPAdapter
+import html
 import json
 import os
 from datetime import datetime
+from typing import Optional
 
 # Page configuration
 st.set_page_config(
@@ -13,7 +16,7 @@ st.set_page_config(
 )
 
 # Custom CSS
-st.markdown("""
+CUSTOM_CSS = """
 <style>
     .main { padding-top: 1rem; }
     .stButton>button {
@@ -31,7 +34,57 @@ st.markdown("""
         margin-top: 1rem;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+# Form options
+CATEGORIES = [
+    "Consumer Insights", "Experience", "Futurist", "Marketing", "Technology",
+    "Utility Consumer Insights Sustainability"
+]
+TARGET_AUDIENCES = [
+    "Business Leaders", "Tech Professionals", "Healthcare Professionals",
+    "Marketing Professionals", "C-Suite Executives", "SME Owners",
+    "Startup Founders", "Digital Marketers"
+]
+CONTENT_LENGTHS = ["Short", "Medium", "Long", "Comprehensive"]
+TONES = [
+    "Professional and Insightful", "Casual and Engaging",
+    "Technical and Detailed", "Inspirational"
+]
+CTA_TYPES = ["consultation", "contact", "demo", "whitepaper", "newsletter", "none"]
+
+# Article metadata row
+METADATA_HTML = (
+    "<div style='display:flex;justify-content:space-between;margin-bottom:1rem'>"
+    "<div><strong>Category</strong><br>{category}</div>"
+    "<div><strong>Words</strong><br>{word_count}</div>"
+    "<div><strong>Model</strong><br>{model}</div>"
+    "</div>"
+)
+
+
+def get_http_session() -> requests.Session:
+    """Per-browser-session HTTP client so keep-alive connections are reused across reruns"""
+    if "http" not in st.session_state:
+        http = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=4)
+        http.mount("http://", adapter)
+        http.mount("https://", adapter)
+        st.session_state.http = http
+    return st.session_state.http
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def check_api_health(_http: requests.Session, api_url: str) -> Optional[bool]:
+    """Check API health, cached so widget reruns don't each hit /health"""
+    try:
+        health_response = _http.get(f"{api_url}/health", timeout=3)
+        return health_response.status_code == 200
+    except requests.exceptions.RequestException:
+        return None
+
+
+st.markdown(CUSTOM_CSS, unsafe_allow_html=True)
 
 # Header
 st.title("📝 Jenosize Trend Generator")
@@ -40,14 +93,13 @@ st.title("📝 Jenosize Trend Generator")
 with st.sidebar:
     api_url = st.text_input("API Endpoint", value=os.getenv("API_URL", "http://localhost:8000"))
     # Simple connection status
-    try:
-        health_response = requests.get(f"{api_url}/health", timeout=3)
-        if health_response.status_code == 200:
-            st.success("✅ Connected")
-        else:
-            st.error("❌ API Error")
-    except:
+    api_healthy = check_api_health(get_http_session(), api_url)
+    if api_healthy:
+        st.success("✅ Connected")
+    elif api_healthy is None:
         st.error("❌ No Connection")
+    else:
+        st.error("❌ API Error")
 
 # Main form
 with st.form("article_form"):
@@ -59,11 +111,7 @@ with st.form("article_form"):
             placeholder="e.g., AI in Healthcare"
         )
         
-        category = st.selectbox(
-            "Category *",
-            ["Consumer Insights", "Experience", "Futurist", "Marketing", "Technology", 
-             "Utility Consumer Insights Sustainability"]
-        )
+        category = st.selectbox("Category *", CATEGORIES)
         
         keywords_input = st.text_area(
             "Keywords (one per line) *",
@@ -72,18 +120,9 @@ with st.form("article_form"):
         )
     
     with col2:
-        target_audience = st.selectbox(
-            "Target Audience",
-            ["Business Leaders", "Tech Professionals", "Healthcare Professionals", 
-             "Marketing Professionals", "C-Suite Executives", "SME Owners", 
-             "Startup Founders", "Digital Marketers"]
-        )
+        target_audience = st.selectbox("Target Audience", TARGET_AUDIENCES)
         
-        content_length = st.selectbox(
-            "Content Length",
-            ["Short", "Medium", "Long", "Comprehensive"],
-            index=1
-        )
+        content_length = st.selectbox("Content Length", CONTENT_LENGTHS, index=1)
         
         industry = st.text_input(
             "Industry Focus",
@@ -95,21 +134,14 @@ with st.form("article_form"):
         col_a, col_b = st.columns(2)
         
         with col_a:
-            tone = st.selectbox(
-                "Tone",
-                ["Professional and Insightful", "Casual and Engaging", 
-                 "Technical and Detailed", "Inspirational"]
-            )
+            tone = st.selectbox("Tone", TONES)
             
             include_statistics = st.checkbox("Include Statistics", value=True)
             
             use_style_matching = st.checkbox("Use Style Matching", value=True)
         
         with col_b:
-            call_to_action_type = st.selectbox(
-                "Call-to-Action",
-                ["consultation", "contact", "demo", "whitepaper", "newsletter", "none"]
-            )
+            call_to_action_type = st.selectbox("Call-to-Action", CTA_TYPES)
             
             include_case_studies = st.checkbox("Include Case Studies", value=True)
             
@@ -149,7 +181,7 @@ if submitted:
                     "num_style_examples": num_style_examples
                 }
                 
-                response = requests.post(
+                response = get_http_session().post(
                     f"{api_url}/generate",
                     json=request_data,
                     timeout=120
@@ -158,51 +190,18 @@ if submitted:
                 if response.status_code == 200:
                     result = response.json()
                     
-                    # Display results - extract proper title
+                    # Extract proper title
                     title = result['title']
                     if len(title) > 100:  # If title is too long, create a shorter one
                         title = f"{topic} - {result['metadata']['category']}"
                     
-                    st.markdown(f"## {title}")
-                    
-                    # Simple metadata
-                    col1, col2, col3 = st.columns(3)
-                    with col1:
-                        st.markdown("**Category**")
-                        st.write(result['metadata']['category'])
-                    with col2:
-                        st.metric("Words", result['metadata']['word_count'])
-                    with col3:
-                        st.metric("Model", result['metadata']['model'].title())
-                    
-                    # Content
-                    clean_content = result['content'].replace('\\\\n\\\\n', '\n\n').replace('\\\\n', '\n')
-                    st.markdown(clean_content)
-                    
-                    # Download options
-                    col1, col2 = st.columns(2)
-                    
-                    with col1:
-                        article_text = f"""# {result['title']}\n\n{result['content']}\n\n---\n**Generated by Jenosize Trend Generator**\n- Category: {result['metadata']['category']}\n- Keywords: {', '.join(result['metadata']['keywords'])}\n- Words: {result['metadata']['word_count']}"""
-                        
-                        st.download_button(
-                            "📥 Download Markdown",
-                            data=article_text,
-                            file_name=f"article_{datetime.now().strftime('%Y%m%d_%H%M%S')}.md",
-                            mime="text/markdown"
-                        )
-                    
-                    with col2:
-                        st.download_button(
-                            "📥 Download JSON",
-                            data=json.dumps(result, indent=2),
-                            file_name=f"article_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
-                            mime="application/json"
-                        )
-                    
-                    # Style matching info (if used)
-                    if result.get('style_matching', {}).get('used_style_examples'):
-                        st.success(f"✅ Generated using {len(result['style_matching']['similar_articles'])} style examples")
+                    # Build the download payloads once per generation; reruns
+                    # triggered by other widgets reuse them from session state
+                    st.session_state.last_result = result
+                    st.session_state.article_title = title
+                    st.session_state.article_md = f"""# {result['title']}\n\n{result['content']}\n\n---\n**Generated by Jenosize Trend Generator**\n- Category: {result['metadata']['category']}\n- Keywords: {', '.join(result['metadata']['keywords'])}\n- Words: {result['metadata']['word_count']}"""
+                    st.session_state.article_json = json.dumps(result, indent=2)
+                    st.session_state.article_file_stem = f"article_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
                 
                 else:
                     st.error(f"Generation failed: {response.status_code}")
@@ -217,4 +216,47 @@ if submitted:
             except requests.exceptions.Timeout:
                 st.error("Request timed out. Please try again.")
             except Exception as e:
-                st.error(f"An error occurred: {str(e)}")
\ No newline at end of file
+                st.error(f"An error occurred: {str(e)}")
+
+# Display the most recent article
+if "last_result" in st.session_state:
+    result = st.session_state.last_result
+    
+    st.markdown(f"## {st.session_state.article_title}")
+    
+    # Simple metadata (single element instead of three columns)
+    st.markdown(
+        METADATA_HTML.format(
+            category=html.escape(result['metadata']['category']),
+            word_count=result['metadata']['word_count'],
+            model=html.escape(result['metadata']['model'].title())
+        ),
+        unsafe_allow_html=True
+    )
+    
+    # Content (a single pass also covers the doubled-newline case)
+    clean_content = result['content'].replace('\\\\n', '\n')
+    st.markdown(clean_content)
+    
+    # Download options
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.download_button(
+            "📥 Download Markdown",
+            data=st.session_state.article_md,
+            file_name=f"{st.session_state.article_file_stem}.md",
+            mime="text/markdown"
+        )
+    
+    with col2:
+        st.download_button(
+            "📥 Download JSON",
+            data=st.session_state.article_json,
+            file_name=f"{st.session_state.article_file_stem}.json",
+            mime="application/json"
+        )
+    
+    # Style matching info (if used)
+    if result.get('style_matching', {}).get('used_style_examples'):
+        st.success(f"✅ Generated using {len(result['style_matching']['similar_articles'])} style examples")
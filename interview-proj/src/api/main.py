@@ -1,37 +1,93 @@
 """Main API application"""
 from fastapi import FastAPI, HTTPException, Request, Depends
+from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.security import HTTPBearer
+import asyncio
+import gc
 import logging
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+import anyio
 import os
 from dotenv import load_dotenv
+from pydantic import ValidationError
 
 # Load environment variables from .env file (development only)
 if os.getenv("ENVIRONMENT") != "production":
     load_dotenv()
 
-from src.api.schemas import ArticleRequest, ArticleResponse, ArticleMetadata
+# CUDA allocator settings must be in place before the generator imports torch;
+# expandable segments and rounded block sizes limit fragmentation from variable-length prompts
+os.environ.setdefault(
+    "PYTORCH_CUDA_ALLOC_CONF", "expandable_segments:True,max_split_size_mb:128,roundup_power2_divisions:8"
+)
+
+from src.api.schemas import ArticleRequest, ArticleResponse, ArticleMetadata, ALLOWED_CATEGORIES, CATEGORIES
 from src.api.security import (
     rate_limiter, input_sanitizer, security_headers, request_validator,
-    audit_logger, get_client_ip, APIKeyAuth
+    audit_logger, get_client_ip, APIKeyAuth, SecurityMiddleware
 )
 from src.model.generator import JenosizeTrendGenerator
 from src.model.config import ModelConfig
+from src.model.timestamps import iso_now
 from src.style_matcher.integrated_generator import StyleAwareContentGenerator
 
 # Setup logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Threads available for blocking generation calls (mostly waiting on LLM APIs)
+GENERATION_THREADS = int(os.getenv("GENERATION_THREADS", 64))
+
+def initialize_generators():
+    """Initialize the style-aware generator and the legacy fallback generator"""
+    try:
+        logger.info("Initializing style-aware content generator...")
+        config = ModelConfig()
+        style_generator = StyleAwareContentGenerator(config)
+        
+        # Initialize the style system
+        logger.info("Loading Jenosize article database and style matching...")
+        style_generator.initialize_style_system()
+        
+        # Keep legacy generator for fallback; reuse the instance the style
+        # generator already built so model weights are only loaded once
+        generator = style_generator.content_generator
+        logger.info("Style-aware generator initialized successfully")
+    except Exception as e:
+        logger.error(f"Failed to initialize style-aware generator: {e}")
+        style_generator = None
+        generator = JenosizeTrendGenerator()  # Fallback to mock
+    
+    return style_generator, generator
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Load models once at server start instead of at module import"""
+    # Size the pools behind asyncio.to_thread and FastAPI's sync handlers
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=GENERATION_THREADS, thread_name_prefix="generate")
+    )
+    anyio.to_thread.current_default_thread_limiter().total_tokens = GENERATION_THREADS
+    app.state.style_generator, app.state.generator = await asyncio.to_thread(initialize_generators)
+    # Move the long-lived startup objects (models, article database) out of
+    # the collector's reach so later collections only scan request garbage
+    gc.collect()
+    gc.freeze()
+    yield
+
 # Initialize FastAPI
 app = FastAPI(
     title="Jenosize Trend Articles Generator API",
     description="Generate high-quality business trend articles using AI",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
 # Add CORS middleware
@@ -43,58 +99,21 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress multi-KB article payloads
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 # Initialize security
 api_keys = os.getenv("API_KEYS", "").split(",") if os.getenv("API_KEYS") else []
 api_key_auth = APIKeyAuth(api_keys) if api_keys else APIKeyAuth()
 
-# Initialize model with style matching
-try:
-    logger.info("Initializing style-aware content generator...")
-    config = ModelConfig()
-    style_generator = StyleAwareContentGenerator(config)
-    
-    # Initialize the style system
-    logger.info("Loading Jenosize article database and style matching...")
-    style_generator.initialize_style_system()
-    
-    # Keep legacy generator for fallback
-    generator = JenosizeTrendGenerator(config)
-    logger.info("Style-aware generator initialized successfully")
-except Exception as e:
-    logger.error(f"Failed to initialize style-aware generator: {e}")
-    style_generator = None
-    generator = JenosizeTrendGenerator()  # Fallback to mock
-
-# Security middleware
-@app.middleware("http")
-async def security_middleware(request: Request, call_next):
-    """Add security headers and rate limiting"""
-    
-    # Get client info
-    client_ip = get_client_ip(request)
-    user_agent = request.headers.get("user-agent", "unknown")
-    
-    # Log request
-    audit_logger.log_request(request, client_ip, user_agent)
-    
-    # Rate limiting (skip for health checks)
-    if request.url.path not in ["/", "/health", "/docs", "/redoc", "/openapi.json"]:
-        allowed, message = rate_limiter.is_allowed(client_ip)
-        if not allowed:
-            audit_logger.log_rate_limit_exceeded(client_ip, "global")
-            return JSONResponse(
-                status_code=429,
-                content={"detail": message}
-            )
-    
-    # Process request
-    response = await call_next(request)
-    
-    # Add security headers
-    for key, value in security_headers.get_security_headers().items():
-        response.headers[key] = value
-    
-    return response
+# Security middleware (pure ASGI, outermost)
+app.add_middleware(
+    SecurityMiddleware,
+    rate_limiter=rate_limiter,
+    headers=security_headers,
+    audit_logger=audit_logger,
+    skip_paths=["/", "/health", "/docs", "/redoc", "/openapi.json"]
+)
 
 @app.get("/")
 async def root():
@@ -115,8 +134,10 @@ async def root():
     }
 
 @app.get("/health")
-async def health_check():
+async def health_check(request: Request):
     """Health check endpoint"""
+    generator = request.app.state.generator
+    style_generator = request.app.state.style_generator
     generator_type = "mock"
     style_matching_enabled = False
     
@@ -129,43 +150,54 @@ async def health_check():
     
     return {
         "status": "healthy",
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": iso_now(),
         "generator_type": generator_type,
         "style_matching_enabled": style_matching_enabled,
         "article_database_size": len(style_generator.style_matcher.articles) if style_generator and style_generator.style_ready else 0
     }
 
-@app.post("/generate", response_model=ArticleResponse)
+@app.post(
+    "/generate",
+    response_model=ArticleResponse,
+    # The body is parsed inside the endpoint, so document it explicitly
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": ArticleRequest.model_json_schema()}}
+        }
+    }
+)
 async def generate_article(
-    request: ArticleRequest, 
     http_request: Request,
     credentials = Depends(api_key_auth)
 ):
     """Generate a trend article based on provided parameters"""
     
+    generator = http_request.app.state.generator
+    style_generator = http_request.app.state.style_generator
+    
+    # Read the body once: check size and content type, then validate the same bytes
+    body = await http_request.body()
+    request_validator.validate_request_size(body)
+    request_validator.validate_content_type(http_request.headers.get("content-type", ""))
+    try:
+        request = ArticleRequest.model_validate_json(body)
+    except ValidationError as e:
+        raise RequestValidationError(
+            [{**error, "loc": ("body", *error["loc"])} for error in e.errors()]
+        )
+    
     try:
         # Get client info
         client_ip = get_client_ip(http_request)
         
         # Input validation and sanitization
         try:
-            # Validate request body size
-            body = await http_request.body()
-            request_validator.validate_request_size(body)
-            
-            # Validate content type
-            content_type = http_request.headers.get("content-type", "")
-            request_validator.validate_content_type(content_type)
-            
             # Sanitize core inputs
             topic = input_sanitizer.sanitize_string(request.topic, request_validator.MAX_TOPIC_LENGTH)
             
             # Validate category - use exact Jenosize scraped categories
-            allowed_categories = [
-                "Consumer Insights", "Experience", "Futurist", "Marketing", "Technology", 
-                "Utility Consumer Insights Sustainability"
-            ]
-            category = input_sanitizer.validate_category(request.category, allowed_categories)
+            category = input_sanitizer.validate_category(request.category, CATEGORIES, ALLOWED_CATEGORIES)
             
             # Sanitize keywords (increased limit for enhanced functionality)
             keywords = input_sanitizer.sanitize_keywords(
@@ -219,10 +251,12 @@ async def generate_article(
         if data_source:
             logger.info(f"Data source: {data_source}")
             
-        # Generate article with enhanced parameters
+        # Generate article with enhanced parameters off the event loop so
+        # concurrent requests (and /health) are not blocked during generation
         if style_generator and style_generator.style_ready:
             logger.info("Using style-aware generation with enhanced Jenosize parameters")
-            result = style_generator.generate_with_enhanced_parameters(
+            result = await asyncio.to_thread(
+                style_generator.generate_with_enhanced_parameters,
                 topic=topic,
                 category=category,
                 keywords=keywords,
@@ -240,7 +274,8 @@ async def generate_article(
             )
         else:
             logger.info("Using standard generation (style matching not available)")
-            result = generator.generate_article(
+            result = await asyncio.to_thread(
+                generator.generate_article,
                 topic=topic,
                 category=category,
                 keywords=keywords,
@@ -248,8 +283,8 @@ async def generate_article(
                 tone=tone
             )
         
-        # Create enhanced metadata
-        metadata = ArticleMetadata(
+        # Create enhanced metadata (trusted server-side data, so skip validation)
+        metadata = ArticleMetadata.model_construct(
             # Core content metadata
             category=result["metadata"]["category"],
             keywords=result["metadata"]["keywords"],
@@ -280,14 +315,16 @@ async def generate_article(
         )
         
         # Create response
-        response = ArticleResponse(
+        response = ArticleResponse.model_construct(
             title=result["title"],
             content=result["content"],
             metadata=metadata
         )
         
         logger.info(f"Article generated successfully: {response.title}")
-        return response
+        # The response was built with model_construct and is never validated; its fields
+        # are trusted from the generator. Returning it directly also skips response_model
+        return ORJSONResponse(response.model_dump())
         
     except HTTPException:
         raise
@@ -306,8 +343,9 @@ async def get_rate_limit_status(request: Request):
 
 # Style matching endpoints
 @app.get("/style-recommendations")
-async def get_style_recommendations(topic: str, num_recommendations: int = 5):
+async def get_style_recommendations(request: Request, topic: str, num_recommendations: int = 5):
     """Get style recommendations for a given topic"""
+    style_generator = request.app.state.style_generator
     if not style_generator or not style_generator.style_ready:
         raise HTTPException(status_code=503, detail="Style matching system not available")
     
@@ -323,8 +361,9 @@ async def get_style_recommendations(topic: str, num_recommendations: int = 5):
         raise HTTPException(status_code=500, detail=f"Failed to get recommendations: {str(e)}")
 
 @app.get("/style-categories")
-async def get_available_categories():
+async def get_available_categories(request: Request):
     """Get available Jenosize categories for style matching"""
+    style_generator = request.app.state.style_generator
     if not style_generator or not style_generator.style_ready:
         raise HTTPException(status_code=503, detail="Style matching system not available")
     
@@ -357,12 +396,32 @@ async def global_exception_handler(request, exc):
     client_ip = get_client_ip(request)
     audit_logger.log_security_violation(client_ip, "unhandled_exception", str(exc))
     logger.error(f"Global exception: {exc}")
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={"detail": "Internal server error", "type": str(type(exc).__name__)}
     )
 
+def worker_count() -> int:
+    """Uvicorn workers for the launchers: WEB_CONCURRENCY if set, otherwise one"""
+    # Every worker loads its own models and keeps its own rate-limit counters,
+    # and a local Hugging Face model must only be loaded once, so the
+    # generator's micro-batching is what shares it between requests
+    if ModelConfig().provider == "huggingface":
+        return 1
+    return int(os.getenv("WEB_CONCURRENCY", 1))
+
 if __name__ == "__main__":
     import uvicorn
     port = int(os.getenv("PORT", 8000))
-    uvicorn.run(app, host="0.0.0.0", port=port)
\ No newline at end of file
+    workers = worker_count()
+    if workers > 1:
+        logger.warning(f"Starting {workers} workers; per-IP rate limits apply per worker")
+    uvicorn.run(
+        "src.api.main:app",
+        host="0.0.0.0",
+        port=port,
+        workers=workers,
+        loop="uvloop",
+        http="httptools",
+        access_log=False
+    )
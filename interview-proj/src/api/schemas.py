@@ -1,14 +1,28 @@
 """API request/response schemas"""
-from pydantic import BaseModel, Field, validator
-from typing import List, Optional, Dict
+from pydantic import BaseModel, Field, StringConstraints, field_validator
+from typing import Annotated, List, Optional, Dict
 from datetime import datetime
 
+# Exact Jenosize categories, in display order
+CATEGORIES = ("Consumer Insights", "Experience", "Futurist", "Marketing", "Technology",
+              "Utility Consumer Insights Sustainability")
+CONTENT_LENGTHS = ("Short", "Medium", "Long", "Comprehensive")
+CTA_TYPES = ("consultation", "contact", "demo", "whitepaper", "newsletter", "none")
+
+# Hash sets for O(1) membership checks
+ALLOWED_CATEGORIES = frozenset(CATEGORIES)
+ALLOWED_CONTENT_LENGTHS = frozenset(CONTENT_LENGTHS)
+ALLOWED_CTA_TYPES = frozenset(CTA_TYPES)
+
+# Keywords are trimmed and lowercased by pydantic-core itself
+Keyword = Annotated[str, StringConstraints(strip_whitespace=True, to_lower=True)]
+
 class ArticleRequest(BaseModel):
     """Enhanced request schema for comprehensive article generation"""
     # Core content parameters
     topic: str = Field(..., min_length=3, max_length=200, description="Main article topic")
     category: str = Field(..., description="Jenosize content category")
-    keywords: List[str] = Field(..., min_items=1, max_items=15, description="SEO keywords for optimization")
+    keywords: List[Keyword] = Field(..., min_length=1, max_length=15, description="SEO keywords for optimization")
     
     # Industry and audience targeting
     industry: Optional[str] = Field(None, max_length=100, description="Specific industry focus (e.g., Healthcare, Fintech, E-commerce)")
@@ -31,34 +45,29 @@ class ArticleRequest(BaseModel):
     use_style_matching: Optional[bool] = Field(default=True, description="Use Jenosize style matching system")
     num_style_examples: Optional[int] = Field(default=3, ge=1, le=5, description="Number of style examples to use")
     
-    @validator('category')
+    @field_validator('category')
+    @classmethod
     def validate_category(cls, v):
         # Use exact Jenosize categories
-        allowed = ["Consumer Insights", "Experience", "Futurist", "Marketing", "Technology", 
-                  "Utility Consumer Insights Sustainability"]
-        if v not in allowed:
-            raise ValueError(f"Category must be one of: {', '.join(allowed)}")
+        if v not in ALLOWED_CATEGORIES:
+            raise ValueError(f"Category must be one of: {', '.join(CATEGORIES)}")
         return v
     
-    @validator('content_length')
+    @field_validator('content_length')
+    @classmethod
     def validate_content_length(cls, v):
         if v is not None:
-            allowed = ["Short", "Medium", "Long", "Comprehensive"]
-            if v not in allowed:
-                raise ValueError(f"Content length must be one of: {', '.join(allowed)}")
+            if v not in ALLOWED_CONTENT_LENGTHS:
+                raise ValueError(f"Content length must be one of: {', '.join(CONTENT_LENGTHS)}")
         return v
     
-    @validator('call_to_action_type')
+    @field_validator('call_to_action_type')
+    @classmethod
     def validate_cta_type(cls, v):
         if v is not None:
-            allowed = ["consultation", "contact", "demo", "whitepaper", "newsletter", "none"]
-            if v not in allowed:
-                raise ValueError(f"CTA type must be one of: {', '.join(allowed)}")
+            if v not in ALLOWED_CTA_TYPES:
+                raise ValueError(f"CTA type must be one of: {', '.join(CTA_TYPES)}")
         return v
-    
-    @validator('keywords', each_item=True)
-    def clean_keywords(cls, v):
-        return v.strip().lower()
 
 class ArticleMetadata(BaseModel):
     """Enhanced metadata for generated article"""
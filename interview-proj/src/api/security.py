@@ -1,77 +1,114 @@
 """Security utilities and middleware for the API"""
 import re
 import time
+import atexit
+import queue
 import hashlib
 import secrets
-from typing import Optional, Dict, List
-from collections import defaultdict, deque
-from datetime import datetime, timedelta
+from typing import AbstractSet, Optional, Dict, Iterable, List, Sequence
+from array import array
+from collections import defaultdict
 import logging
+from logging.handlers import QueueHandler, QueueListener
 
 from fastapi import HTTPException, Request, status
+from fastapi.responses import ORJSONResponse
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 import html
 
 logger = logging.getLogger(__name__)
 
 
+class BucketWindow:
+    """Request counter over a sliding window made of fixed-width time buckets"""
+    
+    __slots__ = ("bucket_seconds", "counts", "head", "total")
+    
+    def __init__(self, buckets: int, bucket_seconds: int):
+        self.bucket_seconds = bucket_seconds
+        self.counts = array('I', [0]) * buckets
+        self.head = 0  # Absolute index of the newest bucket
+        self.total = 0
+    
+    def advance(self, now: float) -> int:
+        """Zero the buckets that fell out of the window and return the current total"""
+        current = int(now // self.bucket_seconds)
+        elapsed = current - self.head
+        if elapsed > 0:
+            size = len(self.counts)
+            if elapsed >= size:
+                self.counts = array('I', [0]) * size
+                self.total = 0
+            else:
+                for bucket in range(self.head + 1, current + 1):
+                    slot = bucket % size
+                    self.total -= self.counts[slot]
+                    self.counts[slot] = 0
+            self.head = current
+        return self.total
+    
+    def add(self) -> None:
+        """Count one request in the newest bucket"""
+        self.counts[self.head % len(self.counts)] += 1
+        self.total += 1
+
+
 class RateLimiter:
-    """Simple in-memory rate limiter"""
+    """Simple in-memory rate limiter using bucketed sliding windows"""
     
     def __init__(self, requests_per_minute: int = 10, requests_per_hour: int = 100):
         self.requests_per_minute = requests_per_minute
         self.requests_per_hour = requests_per_hour
-        self.minute_requests = defaultdict(deque)  # IP -> deque of timestamps
-        self.hour_requests = defaultdict(deque)
+        # IP -> 60 one-second buckets / 60 one-minute buckets
+        self.minute_requests: Dict[str, BucketWindow] = defaultdict(lambda: BucketWindow(60, 1))
+        self.hour_requests: Dict[str, BucketWindow] = defaultdict(lambda: BucketWindow(60, 60))
+        self.prune_interval = 60  # seconds between sweeps for idle clients
+        self.next_prune = time.monotonic() + self.prune_interval
     
     def is_allowed(self, client_ip: str) -> tuple[bool, Optional[str]]:
         """Check if request is allowed for given IP"""
-        now = datetime.now()
-        
-        # Clean old entries
-        self._clean_old_requests(client_ip, now)
+        now = time.monotonic()
+        if now >= self.next_prune:
+            self._prune(now)
+        minute_window = self.minute_requests[client_ip]
+        hour_window = self.hour_requests[client_ip]
         
         # Check minute limit
-        if len(self.minute_requests[client_ip]) >= self.requests_per_minute:
+        if minute_window.advance(now) >= self.requests_per_minute:
             return False, f"Rate limit exceeded: {self.requests_per_minute} requests per minute"
         
         # Check hour limit
-        if len(self.hour_requests[client_ip]) >= self.requests_per_hour:
+        if hour_window.advance(now) >= self.requests_per_hour:
             return False, f"Rate limit exceeded: {self.requests_per_hour} requests per hour"
         
         # Add current request
-        self.minute_requests[client_ip].append(now)
-        self.hour_requests[client_ip].append(now)
+        minute_window.add()
+        hour_window.add()
         
         return True, None
     
-    def _clean_old_requests(self, client_ip: str, now: datetime):
-        """Remove old requests from tracking"""
-        minute_ago = now - timedelta(minutes=1)
-        hour_ago = now - timedelta(hours=1)
-        
-        # Clean minute requests
-        while (self.minute_requests[client_ip] and 
-               self.minute_requests[client_ip][0] < minute_ago):
-            self.minute_requests[client_ip].popleft()
-        
-        # Clean hour requests  
-        while (self.hour_requests[client_ip] and
-               self.hour_requests[client_ip][0] < hour_ago):
-            self.hour_requests[client_ip].popleft()
+    def _prune(self, now: float) -> None:
+        """Forget clients with no requests left in the hour window"""
+        idle = [ip for ip, window in self.hour_requests.items() if window.advance(now) == 0]
+        for ip in idle:
+            del self.hour_requests[ip]
+            self.minute_requests.pop(ip, None)
+        self.next_prune = now + self.prune_interval
     
     def get_status(self, client_ip: str) -> Dict:
         """Get rate limit status for IP"""
-        now = datetime.now()
-        self._clean_old_requests(client_ip, now)
+        now = time.monotonic()
+        minute_count = self.minute_requests[client_ip].advance(now)
+        hour_count = self.hour_requests[client_ip].advance(now)
         
         return {
-            "requests_this_minute": len(self.minute_requests[client_ip]),
-            "requests_this_hour": len(self.hour_requests[client_ip]),
+            "requests_this_minute": minute_count,
+            "requests_this_hour": hour_count,
             "minute_limit": self.requests_per_minute,
             "hour_limit": self.requests_per_hour,
-            "minute_remaining": max(0, self.requests_per_minute - len(self.minute_requests[client_ip])),
-            "hour_remaining": max(0, self.requests_per_hour - len(self.hour_requests[client_ip]))
+            "minute_remaining": max(0, self.requests_per_minute - minute_count),
+            "hour_remaining": max(0, self.requests_per_hour - hour_count)
         }
 
 
@@ -154,8 +191,9 @@ class InputSanitizer:
         return sanitized
     
     @classmethod
-    def validate_category(cls, category: str, allowed_categories: List[str]) -> str:
-        """Validate category against allowed values"""
+    def validate_category(cls, category: str, categories: Sequence[str],
+                          allowed_categories: Optional[AbstractSet[str]] = None) -> str:
+        """Validate category against allowed values; categories sets the order shown in errors"""
         if not category:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -164,10 +202,11 @@ class InputSanitizer:
         
         sanitized_category = cls.sanitize_string(category, 100)
         
-        if sanitized_category not in allowed_categories:
+        # allowed_categories, when given, is a set of categories for O(1) membership
+        if sanitized_category not in (allowed_categories or categories):
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Invalid category. Allowed: {', '.join(allowed_categories)}"
+                detail=f"Invalid category. Allowed: {', '.join(categories)}"
             )
         
         return sanitized_category
@@ -202,6 +241,49 @@ class SecurityHeaders:
         }
 
 
+class SecurityMiddleware:
+    """Pure ASGI middleware for audit logging, rate limiting and security headers"""
+    
+    def __init__(self, app: ASGIApp, rate_limiter: RateLimiter, headers: SecurityHeaders,
+                 audit_logger: "AuditLogger", skip_paths: Iterable[str] = ()):
+        self.app = app
+        self.rate_limiter = rate_limiter
+        self.audit_logger = audit_logger
+        # Encode the static security headers once instead of per response
+        self.encoded_headers = [
+            (key.lower().encode("latin-1"), value.encode("latin-1"))
+            for key, value in headers.get_security_headers().items()
+        ]
+        self.skip_paths = frozenset(skip_paths)
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        # Get client info
+        client_ip, user_agent = scan_client_headers(scope)
+        
+        # Log request
+        self.audit_logger.log_request(Request(scope), client_ip, user_agent)
+        
+        # Rate limiting (skip for health checks and docs)
+        if scope["path"] not in self.skip_paths:
+            allowed, message = self.rate_limiter.is_allowed(client_ip)
+            if not allowed:
+                self.audit_logger.log_rate_limit_exceeded(client_ip, "global")
+                response = ORJSONResponse(status_code=429, content={"detail": message})
+                await response(scope, receive, send)
+                return
+        
+        async def send_with_security_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = list(message.get("headers", ())) + self.encoded_headers
+            await send(message)
+        
+        await self.app(scope, receive, send_with_security_headers)
+
+
 class APIKeyAuth(HTTPBearer):
     """Simple API key authentication"""
     
@@ -281,27 +363,44 @@ class RequestValidator:
         check_depth(data)
 
 
+class DroppingQueueHandler(QueueHandler):
+    """Queue handler that drops records instead of blocking when the queue is full"""
+    
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            pass
+
+
 class AuditLogger:
     """Audit logging for security events"""
     
-    def __init__(self):
+    def __init__(self, max_queue_size: int = 10_000):
         self.logger = logging.getLogger("security_audit")
+        self.listener = None
         
-        # Create handler if not exists
+        # Create handler if not exists; requests only enqueue records and a
+        # background listener thread does the stream writes
         if not self.logger.handlers:
             handler = logging.StreamHandler()
             formatter = logging.Formatter(
                 '%(asctime)s - SECURITY - %(levelname)s - %(message)s'
             )
             handler.setFormatter(formatter)
-            self.logger.addHandler(handler)
+            records = queue.Queue(maxsize=max_queue_size)
+            self.logger.addHandler(DroppingQueueHandler(records))
             self.logger.setLevel(logging.INFO)
+            self.logger.propagate = False  # Root handlers would write on the request thread
+            self.listener = QueueListener(records, handler)
+            self.listener.start()
+            atexit.register(self.listener.stop)
     
     def log_request(self, request: Request, client_ip: str, user_agent: str):
         """Log incoming request"""
         self.logger.info(
             f"REQUEST - IP: {client_ip}, "
-            f"Path: {request.url.path}, "
+            f"Path: {request.scope['path']}, "
             f"Method: {request.method}, "
             f"User-Agent: {user_agent[:100]}"
         )
@@ -356,6 +455,30 @@ def get_client_ip(request: Request) -> str:
     return "unknown"
 
 
+def scan_client_headers(scope: Scope) -> tuple[str, str]:
+    """Get client IP and user agent with one pass over the raw ASGI headers"""
+    forwarded_for = real_ip = user_agent = b""
+    for key, value in scope["headers"]:
+        if key == b"x-forwarded-for":
+            forwarded_for = forwarded_for or value
+        elif key == b"x-real-ip":
+            real_ip = real_ip or value
+        elif key == b"user-agent":
+            user_agent = user_agent or value
+    
+    # Same precedence as get_client_ip
+    if forwarded_for:
+        client_ip = forwarded_for.split(b",")[0].strip().decode("latin-1")
+    elif real_ip:
+        client_ip = real_ip.decode("latin-1")
+    elif scope.get("client"):
+        client_ip = scope["client"][0]
+    else:
+        client_ip = "unknown"
+    
+    return client_ip, user_agent.decode("latin-1") if user_agent else "unknown"
+
+
 def generate_api_key(length: int = 32) -> str:
     """Generate a secure API key"""
     return secrets.token_urlsafe(length)
@@ -371,6 +494,7 @@ __all__ = [
     'RateLimiter', 
     'InputSanitizer', 
     'SecurityHeaders', 
+    'SecurityMiddleware',
     'APIKeyAuth',
     'RequestValidator',
     'AuditLogger',
@@ -380,6 +504,7 @@ __all__ = [
     'request_validator',
     'audit_logger',
     'get_client_ip',
+    'scan_client_headers',
     'generate_api_key',
     'hash_api_key'
 ]
\ No newline at end of file
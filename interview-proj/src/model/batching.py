@@ -0,0 +1,56 @@
+"""Micro-batching of concurrent generation requests"""
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Callable, List, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class GenerationBatcher:
+    """Coalesce prompts submitted from concurrent threads into batched generate calls"""
+
+    def __init__(self, run_batch: Callable[[List[str]], List[str]],
+                 max_batch_size: int = 8, max_wait: float = 0.01):
+        self.run_batch = run_batch
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self._queue: "queue.Queue[Tuple[str, Future]]" = queue.Queue()
+        self._worker = threading.Thread(target=self._drain, name="generation-batcher", daemon=True)
+        self._worker.start()
+
+    def submit(self, prompt: str) -> str:
+        """Queue a prompt and block until its batch has been generated"""
+        future: Future = Future()
+        self._queue.put((prompt, future))
+        return future.result()
+
+    def _collect(self) -> List[Tuple[str, Future]]:
+        """Wait for one prompt, then gather more until the batch fills or the window closes"""
+        batch = [self._queue.get()]
+        deadline = time.monotonic() + self.max_wait
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _drain(self) -> None:
+        """Worker loop: run each collected batch and hand results back to the callers"""
+        while True:
+            batch = self._collect()
+            try:
+                outputs = self.run_batch([prompt for prompt, _ in batch])
+            except BaseException as e:
+                logger.error(f"Batched generation failed for {len(batch)} prompt(s): {e}")
+                for _, future in batch:
+                    future.set_exception(e)
+                continue
+            for (_, future), output in zip(batch, outputs):
+                future.set_result(output)
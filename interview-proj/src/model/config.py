@@ -1,8 +1,11 @@
 """Model configuration"""
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 import os
 from typing import Optional
 
+# Upper bound on max_tokens by model-name prefix (first match wins)
+MAX_TOKENS_BY_PREFIX = (("claude-3", 4096), ("gpt-4", 8192), ("gpt-3.5", 4096))
+
 @dataclass
 class ModelConfig:
     """Configuration for model and generation"""
@@ -12,6 +15,7 @@ class ModelConfig:
     openai_api_key: Optional[str] = None
     claude_api_key: Optional[str] = None
     max_tokens: int = 1000
+    max_length: int = field(init=False, repr=False)  # Backward compatibility alias of max_tokens
     
     # Generation parameters
     temperature: float = 0.8
@@ -19,6 +23,16 @@ class ModelConfig:
     top_k: int = 50
     repetition_penalty: float = 1.2
     
+    # Hugging Face runtime options
+    compile_model: bool = True  # torch.compile the model forward pass on CUDA
+    quantization: Optional[str] = None  # "4bit" (NF4) or "8bit" via bitsandbytes, CUDA only
+    generation_batch_size: int = 8  # Max concurrent prompts per generate() call
+    generation_batch_window_ms: int = 20  # How long to wait for a batch to fill
+    inference_engine: str = "transformers"  # "vllm" for a paged-KV engine, CUDA only
+    gpu_memory_fraction: float = field(  # Share of the GPU for the CUDA allocator or vLLM engine
+        default_factory=lambda: float(os.getenv("JENOSIZE_GPU_FRAC", "0.75"))
+    )
+    
     # OpenAI specific parameters
     frequency_penalty: float = 0.0
     presence_penalty: float = 0.0
@@ -52,16 +66,8 @@ class ModelConfig:
                 self.model_name = "gpt2"
         
         # Adjust max_tokens for different models
-        if self.provider == "claude":
-            if "claude-3" in self.model_name:
-                self.max_tokens = min(self.max_tokens, 4096)
-        elif self.provider == "openai":
-            if self.model_name.startswith("gpt-4"):
-                self.max_tokens = min(self.max_tokens, 8192)
-            elif self.model_name.startswith("gpt-3.5"):
-                self.max_tokens = min(self.max_tokens, 4096)
-    
-    @property
-    def max_length(self) -> int:
-        """Backward compatibility property"""
-        return self.max_tokens
\ No newline at end of file
+        for prefix, limit in MAX_TOKENS_BY_PREFIX:
+            if self.model_name.startswith(prefix):
+                self.max_tokens = min(self.max_tokens, limit)
+                break
+        self.max_length = self.max_tokens
\ No newline at end of file
@@ -2,14 +2,18 @@
 import logging
 import os
 import hashlib
-import json
-from typing import Dict, List, Optional
-from datetime import datetime, timedelta
+import orjson
+from typing import Callable, Dict, List, Optional, Tuple
+from collections import Counter, OrderedDict
+from string import Formatter
 from functools import lru_cache
 import threading
 import time
-import gc
+from concurrent.futures import Future
 from .quality_scorer import quality_scorer
+from .timestamps import iso_now
+from .batching import GenerationBatcher
+from .semantic_cache import SemanticCache
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -18,10 +22,12 @@ logger = logging.getLogger(__name__)
 # Import AI dependencies with better error handling
 try:
     import torch
-    from transformers import AutoModelForCausalLM, AutoTokenizer, GenerationConfig
+    from transformers import AutoConfig, AutoModelForCausalLM, AutoTokenizer, BitsAndBytesConfig, GenerationConfig
     from transformers.utils import logging as transformers_logging
     # Reduce transformers logging noise
     transformers_logging.set_verbosity_error()
+    # Allow TF32 for any float32 matmuls on Ampere+ GPUs
+    torch.set_float32_matmul_precision("high")
     TRANSFORMERS_AVAILABLE = True
 except ImportError as e:
     logger.warning(f"Transformers not available ({e})")
@@ -30,6 +36,12 @@ except Exception as e:
     logger.error(f"Error loading transformers: {e}")
     TRANSFORMERS_AVAILABLE = False
 
+try:
+    from vllm import LLM, SamplingParams
+    VLLM_AVAILABLE = True
+except ImportError:
+    VLLM_AVAILABLE = False
+
 try:
     from openai import OpenAI, RateLimitError
     from .openai_handler import OpenAIHandler
@@ -58,56 +70,660 @@ else:
     logger.warning("No AI dependencies available, using mock generator only")
 
 
+# Jenosize section templates (from actual articles), compiled once at import
+# and filled in a single str.format_map pass per request
+WHAT_IS_SECTION_TEMPLATE = """What Is {topic}?
+{topic} is the strategic process of {core_definition}. The goal is to {primary_objective}, strengthen {key_benefit}, and drive measurable business results. Ultimately, {topic_lower} aims to develop lasting customer relationships.
+
+What does {topic_lower} involve? It depends on the business objectives and market conditions. Examples include:
+• {example_1}
+• {example_2} 
+• {example_3}
+• Performance measurement and analysis
+• Continuous improvement initiatives"""
+
+WHY_IMPORTANT_SECTION_TEMPLATE = """Why Is {topic} Important?
+Traditional traditional methods is no longer enough to meet modern expectations. Today's businesses need to create innovative {topic_lower} strategies that resonate. The importance of {topic_lower} lies in its ability to:
+
+• {benefit_1}: [Explanation with example]
+• {benefit_2}: [Explanation with example]  
+• {benefit_3}: [Explanation with example]
+• Competitive advantage in the market: [Explanation with example]
+• Long-term strategic value creation: [Explanation with example]"""
+
+# Jenosize opening patterns (from actual articles)
+OPENING_TEMPLATES = {
+    "current_context": (
+        "In today's digital era, {topic_lower} has become a critical strategy for brands to stand out.",
+        "Customer experience is no longer just about providing good service—{topic_lower} has become the cornerstone of strategy across all sectors.",
+        "In a time when consumer choices are abundant and attention spans are short, {topic_lower} has emerged as a powerful tool.",
+        "In today's data-driven world, {topic_lower} is key to staying competitive."
+    ),
+    "problem_statement": (
+        "Traditional approaches are no longer enough to capture consumer interest. Today's businesses need {topic_lower} that resonates.",
+        "With cutting-edge technology as a key driver and consumers expecting higher standards, {topic_lower} is set for a dramatic shift.",
+        "But have you ever wondered how {topic_lower} will evolve? The landscape is changing rapidly."
+    )
+}
+
+# Numbered tip/trend item with its pull quote and explanation
+TIP_ITEM_TEMPLATE = """{index}. {tip}
+"Excellence in {tip_lower} drives sustainable competitive advantage."
+Organizations implementing comprehensive {tip_lower} strategies achieve significant improvements in operational efficiency and customer satisfaction. This approach requires systematic planning, dedicated resources, and continuous refinement to deliver measurable business results."""
+
+# Opening by category: technology focus, brand strategy focus, data-driven default
+OPENING_INDEX = {"Futurist": 1, "Technology": 1, "Marketing": 0, "Experience": 0}
+
+# Jenosize conclusion patterns
+CONCLUSION_TEMPLATES = (
+    "{topic} is more than a simple process—it's a strategic communication tool that builds sustainable value.",
+    "In a world where business objectives and market conditions, a well-planned {topic_lower} strategy can set your brand apart and drive long-term success.",
+    "{topic} goes far beyond using basic tools—it's about creating meaningful connections through {key_elements}.",
+    "Businesses that want to thrive must begin laying this foundation today to keep pace with fast-changing expectations."
+)
+
+CONCLUSION_INDEX = {"Marketing": 0, "Experience": 1}
+
+# Jenosize call-to-action
+CTA_TEMPLATE = "If your organization is seeking expert guidance in {topic_lower}, Jenosize offers comprehensive solutions tailored to your goals. Contact us today to get started."
+
+# Jenosize title patterns
+TITLE_TEMPLATES = (
+    "What Is {topic}? {guide_keyword} Guide for {target_audience}",
+    "{trend_count} {topic} Trends to Watch in 2030",
+    "{tip_count} {topic} Tips for Success",
+    "{topic}: Building Better {focus_keyword} for Modern Business",
+    "How to Master {topic}: Insights for {target_audience}"
+)
+TITLE_INDEX = {"Futurist": 1, "Experience": 2}
+
+# Titles for AI-generated articles, by tone
+AI_TITLE_TEMPLATES = {
+    "Professional": (
+        "{topic}: Strategic Market Analysis and Implementation Guide",
+        "Navigating {topic} in Modern {category}",
+        "{topic}: Business Impact and Strategic Opportunities"
+    ),
+    "Technical": (
+        "{topic}: Technical Deep Dive and Best Practices",
+        "Engineering {topic} Solutions for {category}",
+        "{topic}: Architecture and Implementation Strategies"
+    ),
+    "Inspirational": (
+        "Transforming Business with {topic}",
+        "The Future of {category}: {topic} Revolution",
+        "Unlocking Potential: {topic} Success Stories"
+    )
+}
+
+# Casual -> business language replacements, applied in order as whole words
+CASUAL_LANGUAGE_REPLACEMENTS = {
+    'things': 'initiatives',
+    'stuff': 'solutions',
+    'really': 'significantly',
+    'very': 'highly',
+    'good': 'effective',
+    'bad': 'suboptimal',
+    'big': 'substantial',
+    'small': 'targeted'
+}
+
+
+# Mock article layout: Jenosize-style strategic introduction followed by the
+# executive briefing body, with generated sections slotted in
+MOCK_ARTICLE_TEMPLATE = """The convergence of market dynamics and technological innovation in {topic_lower} is creating unprecedented strategic opportunities for forward-thinking organizations. {target_audience} who understand these emerging trends and act decisively will position their organizations as market leaders in an increasingly competitive landscape, while those who delay risk obsolescence in a rapidly transforming business environment.
+
+
+## Executive Summary
+
+{topic} represents a transformative force reshaping the competitive landscape of the {category_lower} sector. Organizations that master these strategic capabilities will capture disproportionate market value, while those that delay implementation face significant competitive disadvantages and potential market displacement.
+
+Current market analysis reveals that early adopters are achieving 25-40% operational improvements and establishing sustainable competitive moats through strategic {innovation_keyword} initiatives.
+
+{industry_insights}
+
+## Strategic Market Dynamics
+
+The convergence of {technology_keyword} and evolving business models is creating unprecedented opportunities for market differentiation. Leading organizations are experiencing:
+
+- **Accelerated Revenue Growth**: Companies implementing comprehensive {solutions_keyword} report 30-50% faster revenue growth
+- **Market Valuation Premium**: Public companies with advanced capabilities trade at 20-35% valuation premiums
+- **Customer Loyalty Enhancement**: Organizations achieve 40-60% improvement in customer retention and lifetime value
+- **Operational Excellence**: Industry leaders realize 25-45% efficiency gains through systematic implementation
+
+{competitive_analysis}
+
+{strategic_framework}
+
+## Future Market Evolution
+
+The strategic trajectory of {topic_lower} indicates accelerating market maturation with increasing competitive differentiation. Organizations establishing leadership positions today will benefit from:
+
+**Network Effects**: Early movers create self-reinforcing advantages through ecosystem development and strategic partnerships that become increasingly difficult for competitors to replicate.
+
+**Regulatory Influence**: Leading organizations shape industry standards and regulatory frameworks, creating favorable competitive conditions for continued market leadership.
+
+**Talent Acquisition**: Market leaders attract top-tier talent and strategic partnerships, further accelerating their competitive advantages and market positioning.
+
+## Executive Action Plan
+
+### Immediate Priorities (0-6 months)
+1. **Strategic Assessment**: Conduct comprehensive evaluation of current capabilities against market leaders
+2. **Investment Authorization**: Secure executive-level commitment and funding for strategic initiatives
+3. **Leadership Alignment**: Ensure C-suite consensus on strategic direction and success metrics
+
+### Medium-term Implementation (6-18 months)
+1. **Capability Development**: Build internal expertise and strategic partnerships
+2. **Pilot Program Launch**: Execute targeted implementations to validate approaches and ROI
+3. **Organizational Transformation**: Adapt structures and processes to support new capabilities
+
+### Long-term Positioning (18+ months)
+1. **Market Leadership**: Establish recognized thought leadership and competitive differentiation
+2. **Ecosystem Development**: Create strategic partnerships and value network advantages
+3. **Continuous Innovation**: Maintain competitive advantages through ongoing capability enhancement
+
+## Strategic Imperatives
+
+The window for establishing market leadership in {topic_lower} is narrowing rapidly. {target_audience} must act decisively to:
+
+**Secure Competitive Positioning**: Organizations that delay strategic investment risk permanent competitive disadvantage as market leaders establish insurmountable advantages.
+
+**Capture Market Value**: Early movers are capturing disproportionate market value creation, with late adopters facing significantly higher implementation costs and reduced strategic benefits.
+
+**Define Industry Standards**: Leading organizations are shaping the competitive landscape, regulatory environment, and customer expectations in ways that favor their continued market dominance.
+
+The strategic imperative is clear: organizations must commit to comprehensive {topic_lower} initiatives now or accept subordinate market positions in the transformed competitive landscape."""
+
+
+# Category insight sections for the mock article: (template, fallback for {keyword})
+INDUSTRY_INSIGHTS_TEMPLATES = {
+    "Technology": ("## Industry Transformation Indicators\n\nThe technology sector is experiencing fundamental structural changes driven by {keyword} adoption. Market research indicates that technology leaders implementing comprehensive strategies achieve 35-50% faster time-to-market and capture 25-40% market share premiums.", "innovation"),
+    "Healthcare": ("## Healthcare Market Evolution\n\nHealthcare organizations leveraging {keyword} capabilities are realizing significant improvements in patient outcomes while reducing operational costs by 20-30%. Regulatory frameworks are evolving to support innovation while maintaining safety standards.", "digital health"),
+    "Finance": ("## Financial Services Disruption\n\nThe financial services landscape is undergoing unprecedented transformation through {keyword} integration. Leading institutions report 40-60% improvement in customer acquisition costs and 25-35% enhancement in customer lifetime value.", "fintech"),
+    "Manufacturing": ("## Manufacturing Renaissance\n\nManufacturing leaders implementing {keyword} initiatives achieve 30-45% improvement in operational efficiency while reducing quality defects by 50-70%. Supply chain resilience has become a critical competitive differentiator.", "Industry 4.0"),
+    "default": ("## Market Transformation Analysis\n\nIndustry analysis reveals that {topic_lower} is creating new competitive dynamics in the {category_lower} sector. Organizations with advanced capabilities are establishing market leadership positions through superior customer value delivery.", None),
+}
+
+STRATEGIC_FRAMEWORK_TEMPLATE = """## Strategic Implementation Framework
+
+### Capability Assessment Matrix
+{target_audience} must evaluate organizational readiness across four critical dimensions:
+
+**Technology Infrastructure**: Current systems' ability to support {primary_keyword} integration and scale requirements for future growth and competitive positioning.
+
+**Organizational Capabilities**: Workforce skills, leadership commitment, and change management capacity to execute comprehensive transformation initiatives successfully.
+
+**Market Positioning**: Competitive landscape analysis and strategic positioning requirements to capture market opportunities and defend against competitive threats.
+
+**Financial Resources**: Investment capacity and ROI expectations for {topic_lower} initiatives, including both direct costs and opportunity costs of delayed implementation.
+
+### Implementation Methodology
+
+**Phase 1 - Strategic Foundation (Months 1-6)**
+- Executive alignment on strategic objectives and success metrics
+- Comprehensive capability assessment and gap analysis
+- Resource allocation and organizational structure optimization
+- Initial pilot program design and launch preparation
+
+**Phase 2 - Tactical Execution (Months 6-18)**  
+- Core capability development and technology integration
+- Workforce development and change management implementation
+- Performance measurement and continuous improvement processes
+- Strategic partnership development and ecosystem creation
+
+**Phase 3 - Market Leadership (Months 18+)**
+- Competitive differentiation and market positioning
+- Advanced capability development and innovation leadership
+- Ecosystem expansion and strategic alliance management
+- Continuous evolution and competitive advantage maintenance"""
+
+COMPETITIVE_ANALYSIS_TEMPLATE = """## Competitive Landscape Analysis
+
+### Market Leader Characteristics
+Organizations achieving market leadership in {topic_lower} demonstrate consistent patterns across strategic, operational, and cultural dimensions:
+
+**Strategic Vision**: Clear articulation of {topic_lower} as core competitive advantage with executive-level commitment and sustained investment over 3-5 year horizons.
+
+**Execution Excellence**: Systematic implementation methodologies with rigorous performance measurement and continuous improvement processes that deliver measurable business outcomes.
+
+**Innovation Culture**: Organizational cultures that embrace experimentation, learning, and adaptation while maintaining operational discipline and customer focus.
+
+### Competitive Differentiation Strategies
+Market leaders create sustainable advantages through:
+
+- **Ecosystem Development**: Building strategic partnerships and value networks that create barriers to competitive entry
+- **Customer Experience Excellence**: Delivering superior customer value through integrated solutions and seamless experiences  
+- **Operational Efficiency**: Achieving cost structures and operational capabilities that enable competitive pricing and superior margins
+- **Innovation Leadership**: Continuous capability enhancement and market-leading product development that sets industry standards
+
+### Market Dynamics Impact
+The competitive implications of {topic_lower} extend beyond direct operational benefits to fundamental market structure changes that favor prepared organizations over reactive competitors."""
+
+
+class _SingleWordFields(dict):
+    """format_map mapping that renders every field as a one-word stand-in"""
+    def __missing__(self, key):
+        return "x"
+
+
+@lru_cache(maxsize=None)
+def template_word_stats(template: str) -> Tuple[int, Counter]:
+    """Word count of a format template with each field as one word, plus field occurrence counts"""
+    field_counts = Counter(field for _, field, _, _ in Formatter().parse(template) if field)
+    return len(template.format_map(_SingleWordFields()).split()), field_counts
+
+
+def format_with_word_count(template: str, fields: Dict[str, str],
+                           known_counts: Optional[Dict[str, int]] = None) -> Tuple[str, int]:
+    """Fill a template and derive its exact word count from the field values alone
+    
+    known_counts gives word counts for values that were themselves rendered this way.
+    """
+    content = template.format_map(fields)
+    known_counts = known_counts or {}
+    word_count, field_counts = template_word_stats(template)
+    for field, occurrences in field_counts.items():
+        value = fields[field]
+        # A field only stands in for one word if it has no edge whitespace
+        if not value or value != value.strip():
+            return content, len(content.split())
+        words = known_counts[field] if field in known_counts else len(value.split())
+        word_count += occurrences * (words - 1)
+    return content, word_count
+
+
+@lru_cache(maxsize=512)
+def render_jenosize_article(topic: str, category: str, keywords: Tuple[str, ...],
+                            target_audience: str) -> Tuple[str, str, int]:
+    """Render a Jenosize-style article as (title, content, word_count), memoized per request"""
+    topic_lower = topic.lower()
+    is_what_is = "what is" in topic_lower
+    is_trends = "trends" in topic_lower
+    is_tips = "tips" in topic_lower
+    
+    # Pad to three keyword slots once; each template supplies its own default
+    kw0, kw1, kw2 = (keywords + (None, None, None))[:3]
+    kw0_title = kw0.title() if kw0 else 'Strategic'
+    
+    # Per-request fields for the precompiled Jenosize templates
+    article_fields = {
+        "topic": topic,
+        "topic_lower": topic_lower,
+        "core_definition": f"leveraging {kw0 or 'strategic approaches'} to achieve business objectives",
+        "primary_objective": f"enhance {kw1 or 'customer engagement'}",
+        "key_benefit": kw2 or 'brand recognition',
+        "example_1": f"{kw0_title} implementation",
+        "example_2": f"{kw1.title() if kw1 else 'Customer'} optimization",
+        "example_3": f"{kw2.title() if kw2 else 'Digital'} transformation",
+        "benefit_1": f"Enhanced {kw0 or 'performance'}",
+        "benefit_2": f"Improved {kw1 or 'efficiency'}",
+        "benefit_3": f"Greater {kw2 or 'impact'}",
+        "key_elements": f"{', '.join(keywords[:3]) if keywords else 'innovation, strategy, and execution'}",
+        "target_audience": target_audience,
+        "guide_keyword": kw0_title,
+        "focus_keyword": kw0 or 'Strategies',
+        "trend_count": len(keywords) + 3,
+        "tip_count": len(keywords) + 2
+    }
+    
+    # Select appropriate opening based on category
+    opening = OPENING_TEMPLATES["current_context"][OPENING_INDEX.get(category, 3)].format_map(article_fields)
+    
+    def create_what_is_section():
+        return WHAT_IS_SECTION_TEMPLATE.format_map(article_fields)
+    
+    def create_why_important_section():
+        return WHY_IMPORTANT_SECTION_TEMPLATE.format_map(article_fields)
+    
+    def create_tips_trends_section():
+        number = 7 if is_tips else 9 if is_trends else 5
+        section_title = f"{number} {topic} {'Trends' if 'trend' in topic_lower or category == 'Futurist' else 'Tips'}"
+        
+        # Create contextual tips based on keywords and category
+        tip_templates = {
+            "Marketing": [
+                f"Strategic {kw0 or 'Brand'} Integration",
+                f"Data-Driven {kw1 or 'Customer'} Insights", 
+                f"Omnichannel {kw2 or 'Experience'} Design",
+                "Performance Measurement and ROI Tracking",
+                "Continuous Optimization and A/B Testing"
+            ],
+            "Technology": [
+                f"Advanced {kw0 or 'AI'} Implementation",
+                f"Scalable {kw1 or 'Cloud'} Architecture",
+                f"Enhanced {kw2 or 'Security'} Protocols",
+                "Real-time Analytics and Monitoring",
+                "Future-proof Integration Planning"
+            ],
+            "default": [
+                f"Strategic {kw0 or 'Innovation'} Planning",
+                f"Systematic {kw1 or 'Implementation'} Approach",
+                f"Quality {kw2 or 'Assurance'} Frameworks",
+                "Performance Metrics and KPI Development",
+                "Stakeholder Engagement and Communication"
+            ]
+        }
+        
+        tips = tip_templates.get(category, tip_templates["default"])
+        
+        items = "\n".join(
+            TIP_ITEM_TEMPLATE.format(index=i, tip=tip, tip_lower=tip.lower())
+            for i, tip in enumerate(tips[:min(number, 5)], 1)
+        )
+        
+        return f"{section_title}\n\n{items}"
+    
+    # Build article content using Jenosize patterns
+    sections = [opening]
+    
+    if is_what_is or category in ("Technology", "Consumer Insights"):
+        sections.append(create_what_is_section())
+        sections.append(create_why_important_section())
+    elif category == "Futurist" or is_trends:
+        sections.append(create_tips_trends_section())
+    elif category == "Experience" or is_tips:
+        sections.append(create_tips_trends_section())
+    else:
+        sections.append(create_what_is_section())
+        sections.append(create_tips_trends_section())
+    
+    conclusion = CONCLUSION_TEMPLATES[CONCLUSION_INDEX.get(category, 2)].format_map(article_fields)
+    
+    # Add Jenosize call-to-action
+    cta = CTA_TEMPLATE.format_map(article_fields)
+    
+    sections.extend([conclusion, cta])
+    
+    full_content = "\n\n".join(sections)
+    # Sections are joined by blank lines, so per-section counts sum to the
+    # article total without splitting the whole article into one token list
+    word_count = sum(len(section.split()) for section in sections)
+    
+    # Generate realistic title using Jenosize patterns
+    title_template = TITLE_TEMPLATES[0 if is_what_is else TITLE_INDEX.get(category, 3)]
+    title = title_template.format_map(article_fields)
+    
+    return title, full_content, word_count
+
+# Batched prompt widths are rounded up to this many tokens on GPU
+PROMPT_PAD_MULTIPLE = 64
+# Prompt truncation and new-token caps for local generation; output budgets are
+# max_new_tokens, so padding and batch composition never shorten an article
+PROMPT_MAX_TOKENS = 512  # A multiple of PROMPT_PAD_MULTIPLE, so padding never exceeds it
+MAX_NEW_TOKENS = 1200
+REDUCED_PROMPT_MAX_TOKENS = 256
+REDUCED_MAX_NEW_TOKENS = 384
+
+
+def _half_precision_dtype() -> 'torch.dtype':
+    """bfloat16 where the GPU supports it (Ampere+), otherwise float16"""
+    return torch.bfloat16 if torch.cuda.is_bf16_supported() else torch.float16
+
+
+def _quantization_config(mode: Optional[str], device: 'torch.device') -> Optional['BitsAndBytesConfig']:
+    """bitsandbytes config for the configured quantization mode (CUDA only)"""
+    if not mode or device.type != "cuda":
+        return None
+    if mode == "4bit":
+        return BitsAndBytesConfig(
+            load_in_4bit=True,
+            bnb_4bit_quant_type="nf4",
+            bnb_4bit_compute_dtype=_half_precision_dtype()
+        )
+    if mode == "8bit":
+        return BitsAndBytesConfig(load_in_8bit=True)
+    logger.warning(f"Unknown quantization mode '{mode}', loading unquantized")
+    return None
+
+
+def _warm_up(tokenizer: 'AutoTokenizer', model: 'AutoModelForCausalLM', device: 'torch.device') -> None:
+    """Run a 4-token generate() so lazy CUDA/cuBLAS setup and compilation happen at load time"""
+    warmup = tokenizer(["Business Article:"], return_tensors="pt").to(device)
+    with torch.inference_mode():
+        model.generate(**warmup, max_new_tokens=4, pad_token_id=tokenizer.pad_token_id)
+
+
+def _load_huggingface_model(model_name: str, device: 'torch.device', quantization: Optional[str],
+                            compile_model: bool) -> Tuple['AutoTokenizer', 'AutoModelForCausalLM']:
+    """Load a tokenizer and model ready for batched inference on device"""
+    # Load tokenizer first (lighter weight)
+    logger.info("Loading tokenizer...")
+    tokenizer = AutoTokenizer.from_pretrained(
+        model_name,
+        trust_remote_code=False,
+        use_fast=True
+    )
+    if not tokenizer.is_fast:
+        logger.warning(f"No Rust tokenizer available for {model_name}; tokenization will be slower")
+    
+    # Set padding token; pad on the left so batched prompts end where generation starts
+    if tokenizer.pad_token is None:
+        tokenizer.pad_token = tokenizer.eos_token
+    tokenizer.padding_side = "left"
+    
+    # Load model with memory optimization
+    logger.info("Loading model (this may take a moment)...")
+    load_kwargs = {
+        "torch_dtype": _half_precision_dtype() if device.type == "cuda" else torch.float32,
+        "device_map": "auto" if device.type == "cuda" else None,
+        "low_cpu_mem_usage": True,
+        "trust_remote_code": False,
+        "attn_implementation": "sdpa"  # Fused scaled-dot-product attention kernels
+    }
+    quantization_config = _quantization_config(quantization, device)
+    if quantization_config is not None:
+        # Weight dtype comes from the quantization config
+        del load_kwargs["torch_dtype"]
+        load_kwargs["quantization_config"] = quantization_config
+    try:
+        model = AutoModelForCausalLM.from_pretrained(model_name, **load_kwargs)
+    except ValueError as e:
+        # Architectures without an SDPA implementation reject the option
+        logger.warning(f"SDPA attention unavailable, using default attention: {e}")
+        del load_kwargs["attn_implementation"]
+        model = AutoModelForCausalLM.from_pretrained(model_name, **load_kwargs)
+    
+    # Move to device if not using device_map
+    if device.type != "cuda" or not hasattr(model, 'hf_device_map'):
+        model = model.to(device)
+    
+    # Set to evaluation mode
+    model.eval()
+    
+    # Compile the forward pass on GPU; generate() calls it once per token
+    warmed_up = False
+    if device.type == "cuda" and compile_model and hasattr(torch, "compile") and quantization_config is None:
+        eager_forward = model.forward
+        try:
+            model.forward = torch.compile(eager_forward, dynamic=True)
+            logger.info("Model forward pass compiled with torch.compile")
+            # Pay compilation now rather than on the first user request
+            _warm_up(tokenizer, model, device)
+            warmed_up = True
+        except Exception as e:
+            model.forward = eager_forward
+            logger.warning(f"torch.compile unavailable, using eager mode: {e}")
+    
+    # Create cuBLAS handles and workspaces while the allocator pool is still empty
+    if device.type == "cuda" and not warmed_up:
+        try:
+            _warm_up(tokenizer, model, device)
+        except Exception as e:
+            logger.warning(f"GPU warm-up failed: {e}")
+    
+    return tokenizer, model
+
+
+# (model name, device, quantization, compile) -> (tokenizer, model)
+_huggingface_models: Dict[Tuple, Tuple] = {}
+_huggingface_models_lock = threading.Lock()
+
+
+def get_huggingface_model(model_name: str, device: 'torch.device', quantization: Optional[str],
+                          compile_model: bool) -> Tuple['AutoTokenizer', 'AutoModelForCausalLM']:
+    """Return the shared tokenizer/model for these settings, loading them on first use"""
+    key = (model_name, str(device), quantization, compile_model)
+    loaded = _huggingface_models.get(key)
+    if loaded is None:
+        with _huggingface_models_lock:
+            loaded = _huggingface_models.get(key)
+            if loaded is None:
+                loaded = _load_huggingface_model(model_name, device, quantization, compile_model)
+                _huggingface_models[key] = loaded
+    return loaded
+
+
+# (model name, max model length, GPU memory fraction) -> engine
+_vllm_engines: Dict[Tuple, 'LLM'] = {}
+_vllm_engines_lock = threading.Lock()
+
+
+def get_vllm_engine(model_name: str, max_model_len: int, gpu_memory_fraction: float) -> 'LLM':
+    """Return the shared vLLM engine for these settings, starting it on first use"""
+    key = (model_name, max_model_len, gpu_memory_fraction)
+    engine = _vllm_engines.get(key)
+    if engine is None:
+        with _vllm_engines_lock:
+            engine = _vllm_engines.get(key)
+            if engine is None:
+                logger.info(f"Starting vLLM engine for {model_name}")
+                engine = LLM(
+                    model=model_name,
+                    gpu_memory_utilization=gpu_memory_fraction,
+                    max_model_len=max_model_len,
+                    enable_prefix_caching=True
+                )
+                _vllm_engines[key] = engine
+    return engine
+
+
+@lru_cache(maxsize=1024)
+def model_cache_key(provider: str, model_name: str, topic: str, category: str,
+                    keywords: Tuple[str, ...], target_audience: str, tone: str) -> str:
+    """Hash the generating backend and parameters into a ModelCache key; keywords must be pre-sorted"""
+    # Unit separator keeps fields unambiguous; BLAKE2b is cheaper than MD5
+    content = "\x1f".join((provider, model_name, topic, category, *keywords, target_audience, tone))
+    return hashlib.blake2b(content.encode(), digest_size=16).hexdigest()
+
+# <repo>/models/cache, independent of the working directory
+MODEL_CACHE_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "models", "cache"
+)
+
 class ModelCache:
-    """Thread-safe model caching with memory management"""
+    """Thread-safe on-disk result cache with a bounded in-memory LRU index
     
-    def __init__(self, cache_dir: str = "models/cache"):
+    The index is per process: entries written by other workers sharing the
+    directory are only picked up at startup, so treat the cache as per-worker.
+    """
+    
+    def __init__(self, cache_dir: str = MODEL_CACHE_DIR, max_entries: int = 512):
         self.cache_dir = cache_dir
-        self.cache = {}
-        self.cache_times = {}
-        self.cache_lock = threading.RLock()
-        self.max_cache_age = timedelta(hours=24)
+        self.cache: "OrderedDict[str, float]" = OrderedDict()  # key -> cached-at epoch seconds, LRU order
+        self.max_entries = max_entries
+        self.cache_lock = threading.Lock()  # Guards index mutations; lookups and file reads go without it
+        self.max_cache_age_s = 24 * 60 * 60.0
         os.makedirs(cache_dir, exist_ok=True)
+        self._load_index()
+    
+    def _path(self, key: str) -> str:
+        """File holding the cached result for key"""
+        return os.path.join(self.cache_dir, f"{key}.json")
     
-    def _get_cache_key(self, topic: str, category: str, keywords: List[str], 
-                      target_audience: str, tone: str) -> str:
-        """Generate cache key from parameters"""
-        content = f"{topic}_{category}_{'_'.join(sorted(keywords))}_{target_audience}_{tone}"
-        return hashlib.md5(content.encode()).hexdigest()
+    def _remove_file(self, key: str) -> None:
+        """Delete a cached result file if it still exists"""
+        try:
+            os.remove(self._path(key))
+        except FileNotFoundError:
+            pass
+    
+    def _load_index(self) -> None:
+        """Index results left on disk by earlier runs so the cache starts warm"""
+        entries = sorted(
+            (entry.stat().st_mtime, entry.name[:-len(".json")])
+            for entry in os.scandir(self.cache_dir)
+            if entry.is_file() and entry.name.endswith(".json")
+        )
+        overflow = max(0, len(entries) - self.max_entries)
+        for _, key in entries[:overflow]:
+            self._remove_file(key)
+        for cached_at, key in entries[overflow:]:
+            self.cache[key] = cached_at
+        self.clear_expired()
+    
+    def _get_cache_key(self, provider: str, model_name: str, topic: str, category: str,
+                       keywords: List[str], target_audience: str, tone: str) -> str:
+        """Generate cache key from the generating backend and request parameters"""
+        return model_cache_key(provider, model_name, topic, category, tuple(sorted(keywords)), target_audience, tone)
     
     def get(self, key: str) -> Optional[Dict]:
         """Get cached result if available and fresh"""
-        with self.cache_lock:
-            if key in self.cache:
-                cache_time = self.cache_times.get(key)
-                if cache_time and datetime.now() - cache_time < self.max_cache_age:
-                    logger.debug(f"Cache hit for key: {key[:8]}...")
-                    return self.cache[key]
-                else:
-                    # Remove expired cache
+        cached_at = self.cache.get(key)
+        if cached_at is None:
+            return None
+        if time.time() - cached_at >= self.max_cache_age_s:
+            # Remove expired cache unless another thread refreshed it meanwhile
+            with self.cache_lock:
+                if self.cache.get(key) == cached_at:
                     del self.cache[key]
-                    if key in self.cache_times:
-                        del self.cache_times[key]
+                    self._remove_file(key)
+            return None
+        try:
+            with open(self._path(key), "rb") as f:
+                value = orjson.loads(f.read())
+        except (OSError, ValueError) as e:
+            logger.warning(f"Dropping unreadable cache entry {key[:8]}: {e}")
+            with self.cache_lock:
+                self.cache.pop(key, None)
             return None
+        with self.cache_lock:
+            if key in self.cache:
+                self.cache.move_to_end(key)
+        logger.debug(f"Cache hit for key: {key[:8]}...")
+        return value
     
     def set(self, key: str, value: Dict) -> None:
-        """Cache result with timestamp"""
+        """Cache result on disk, replacing any previous file atomically"""
+        path = self._path(key)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            data = orjson.dumps(value, default=str, option=orjson.OPT_SERIALIZE_NUMPY)
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except (OSError, TypeError) as e:
+            logger.warning(f"Could not write cache entry {key[:8]}: {e}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return
+        
         with self.cache_lock:
-            self.cache[key] = value
-            self.cache_times[key] = datetime.now()
+            self.cache[key] = time.time()
+            self.cache.move_to_end(key)
+            # Evict least recently used entries beyond the cap
+            while len(self.cache) > self.max_entries:
+                evicted, _ = self.cache.popitem(last=False)
+                self._remove_file(evicted)
             logger.debug(f"Cached result for key: {key[:8]}...")
     
+    def clear(self) -> None:
+        """Remove every cached entry from memory and disk"""
+        with self.cache_lock:
+            for key in self.cache:
+                self._remove_file(key)
+            self.cache.clear()
+    
     def clear_expired(self) -> None:
         """Remove expired cache entries"""
         with self.cache_lock:
-            now = datetime.now()
+            oldest_allowed = time.time() - self.max_cache_age_s
             expired_keys = [
-                key for key, cache_time in self.cache_times.items()
-                if now - cache_time >= self.max_cache_age
+                key for key, cached_at in self.cache.items()
+                if cached_at <= oldest_allowed
             ]
             for key in expired_keys:
                 del self.cache[key]
-                del self.cache_times[key]
+                self._remove_file(key)
             if expired_keys:
                 logger.info(f"Cleared {len(expired_keys)} expired cache entries")
 
@@ -115,24 +731,37 @@ class ModelCache:
 class JenosizeTrendGenerator:
     """Enhanced AI article generator with caching and error handling"""
     
-    def __init__(self, config=None, enable_caching: bool = True):
+    def __init__(self, config=None, enable_caching: bool = True, encoder=None):
         self.config = config
         self.enable_caching = enable_caching
         self.cache = ModelCache() if enable_caching else None
+        self.semantic_cache = None
         self.model = None
+        self.engine = None
         self.tokenizer = None
         self.openai_client = None
         self.openai_handler = None
         self.claude_handler = None
+        self.batcher = None
+        self.generation_config = None
         self.device = None
         self.use_ai = False
         self.provider = "mock"
-        self.model_loading_lock = threading.Lock()
         self.generation_count = 0
-        self.last_gc_time = time.time()
+        self.last_cleanup_time = time.time()
+        self.inflight: Dict[str, Future] = {}  # cache key -> result of the generation in progress
+        self.inflight_lock = threading.Lock()
         
         # Initialize AI model if available
         self._initialize_model()
+        
+        # Shared Redis tier, namespaced by the backend that actually initialized;
+        # encoder is the style matcher's sentence embedder when one is loaded
+        if enable_caching:
+            model_name = self.config.model_name if self.config else ""
+            self.semantic_cache = SemanticCache.from_env(
+                encoder, namespace=f"jenosize:articles:{self.provider}:{model_name}"
+            )
     
     def _initialize_model(self) -> None:
         """Initialize AI model with proper error handling"""
@@ -140,18 +769,17 @@ class JenosizeTrendGenerator:
             logger.info("No configuration provided, using mock generator")
             return
             
-        with self.model_loading_lock:
-            # Try Claude first if configured
-            if self.config.provider == "claude" and CLAUDE_AVAILABLE:
-                self._initialize_claude_model()
-            # Try OpenAI if configured
-            elif self.config.provider == "openai" and OPENAI_AVAILABLE:
-                self._initialize_openai_model()
-            # Fall back to Hugging Face transformers
-            elif self.config.provider == "huggingface" and TRANSFORMERS_AVAILABLE:
-                self._initialize_huggingface_model()
-            else:
-                logger.info("AI not available, using mock generator")
+        # Try Claude first if configured
+        if self.config.provider == "claude" and CLAUDE_AVAILABLE:
+            self._initialize_claude_model()
+        # Try OpenAI if configured
+        elif self.config.provider == "openai" and OPENAI_AVAILABLE:
+            self._initialize_openai_model()
+        # Fall back to Hugging Face transformers
+        elif self.config.provider == "huggingface" and TRANSFORMERS_AVAILABLE:
+            self._initialize_huggingface_model()
+        else:
+            logger.info("AI not available, using mock generator")
     
     def _initialize_claude_model(self) -> None:
         """Initialize Claude model with proper error handling"""
@@ -168,14 +796,8 @@ class JenosizeTrendGenerator:
                 model=self.config.model_name
             )
             
-            # Test connection to verify it works
-            connection_ok = self.claude_handler.test_connection()
-            
-            if connection_ok:
-                logger.info("✅ Claude API connection verified - ready for generation")
-            else:
-                logger.warning("⚠️ Claude API has issues but handler is ready")
-                logger.info("💡 Will attempt API calls during generation with proper error handling")
+            # Test connection to verify it works, without holding up startup
+            self._verify_connection_in_background("Claude", self.claude_handler.test_connection)
             
             # Always set as available - let the handler deal with errors
             self.use_ai = True
@@ -201,13 +823,7 @@ class JenosizeTrendGenerator:
             )
             
             # Test connection to verify it works (but don't fail if quota exceeded)
-            connection_ok = self.openai_handler.test_connection()
-            
-            if connection_ok:
-                logger.info("✅ OpenAI API connection verified - ready for generation")
-            else:
-                logger.warning("⚠️ OpenAI API has issues (likely quota) but handler is ready")
-                logger.info("💡 Will attempt API calls during generation with proper error handling")
+            self._verify_connection_in_background("OpenAI", self.openai_handler.test_connection)
             
             # Always set as available - let the handler deal with errors
             self.use_ai = True
@@ -217,6 +833,17 @@ class JenosizeTrendGenerator:
             logger.error(f"Failed to initialize OpenAI model: {e}")
             logger.info("Falling back to mock generator")
             
+    def _verify_connection_in_background(self, provider_name: str, test_connection: Callable[[], bool]) -> None:
+        """Run a provider connection test off the startup path; the outcome is only logged"""
+        def verify():
+            if test_connection():
+                logger.info(f"✅ {provider_name} API connection verified - ready for generation")
+            else:
+                logger.warning(f"⚠️ {provider_name} API has issues but handler is ready")
+                logger.info("💡 Will attempt API calls during generation with proper error handling")
+        
+        threading.Thread(target=verify, name=f"{provider_name.lower()}-connection-test", daemon=True).start()
+    
     def _initialize_huggingface_model(self) -> None:
         """Initialize Hugging Face model"""
         try:
@@ -233,35 +860,38 @@ class JenosizeTrendGenerator:
                 self.device = torch.device("cpu")
                 logger.info("Using CPU")
             
-            # Load tokenizer first (lighter weight)
-            logger.info("Loading tokenizer...")
-            self.tokenizer = AutoTokenizer.from_pretrained(
-                self.config.model_name,
-                trust_remote_code=False,
-                use_fast=True
-            )
+            if self.config.inference_engine == "vllm" and VLLM_AVAILABLE and self.device.type == "cuda":
+                # Paged KV cache; the engine schedules each batch continuously
+                try:
+                    self.engine = get_vllm_engine(
+                        self.config.model_name, self._vllm_max_model_len(), self.config.gpu_memory_fraction
+                    )
+                    self.tokenizer = self.engine.get_tokenizer()
+                    run_batch = self._generate_batch_vllm
+                except Exception as e:
+                    self.engine = None
+                    logger.warning(f"vLLM engine failed to start, using transformers: {e}")
+            elif self.config.inference_engine == "vllm":
+                logger.warning("vLLM requires the vllm package and a CUDA device, using transformers")
             
-            # Set padding token
-            if self.tokenizer.pad_token is None:
-                self.tokenizer.pad_token = self.tokenizer.eos_token
+            if self.engine is None:
+                if self.device.type == "cuda":
+                    # Leave headroom for cuBLAS/cuDNN workspaces and other processes on the GPU
+                    torch.cuda.set_per_process_memory_fraction(self.config.gpu_memory_fraction, self.device)
+                # Generators with the same settings share one loaded copy
+                self.tokenizer, self.model = get_huggingface_model(
+                    self.config.model_name, self.device, self.config.quantization, self.config.compile_model
+                )
+                self.generation_config = self._build_generation_config()
+                run_batch = self._generate_batch
             
-            # Load model with memory optimization
-            logger.info("Loading model (this may take a moment)...")
-            self.model = AutoModelForCausalLM.from_pretrained(
-                self.config.model_name,
-                torch_dtype=torch.float16 if self.device.type == "cuda" else torch.float32,
-                device_map="auto" if self.device.type == "cuda" else None,
-                low_cpu_mem_usage=True,
-                trust_remote_code=False
+            # Concurrent requests share a single generate() call
+            self.batcher = GenerationBatcher(
+                run_batch,
+                max_batch_size=self.config.generation_batch_size,
+                max_wait=self.config.generation_batch_window_ms / 1000
             )
             
-            # Move to device if not using device_map
-            if self.device.type != "cuda" or not hasattr(self.model, 'hf_device_map'):
-                self.model = self.model.to(self.device)
-            
-            # Set to evaluation mode
-            self.model.eval()
-            
             self.use_ai = True
             self.provider = "huggingface"
             logger.info(f"Hugging Face model initialized successfully on {self.device}")
@@ -283,6 +913,7 @@ class JenosizeTrendGenerator:
             if self.model is not None:
                 del self.model
                 self.model = None
+            self.engine = None
             if self.tokenizer is not None:
                 del self.tokenizer
                 self.tokenizer = None
@@ -291,37 +922,54 @@ class JenosizeTrendGenerator:
             if self.device and self.device.type == "cuda":
                 torch.cuda.empty_cache()
             
-            # Force garbage collection
-            gc.collect()
             logger.info("Model resources cleaned up")
         except Exception as e:
             logger.error(f"Error during model cleanup: {e}")
     
     def _periodic_cleanup(self) -> None:
-        """Periodic memory cleanup"""
+        """Periodic cache maintenance; memory is left to the generational GC"""
         current_time = time.time()
-        if current_time - self.last_gc_time > 300:  # 5 minutes
-            if self.device and self.device.type == "cuda":
-                torch.cuda.empty_cache()
-            gc.collect()
-            self.last_gc_time = current_time
+        if current_time - self.last_cleanup_time > 300:  # 5 minutes
+            self.last_cleanup_time = current_time
             
             if self.cache:
                 self.cache.clear_expired()
     
-    @lru_cache(maxsize=100)
-    def _get_generation_config(self) -> 'GenerationConfig':
-        """Get cached generation configuration"""
+    def _vllm_max_model_len(self) -> int:
+        """Room for a full-length prompt plus the whole output budget, within the model's context"""
+        max_model_len = PROMPT_MAX_TOKENS + min(self.config.max_length, MAX_NEW_TOKENS)
+        # vLLM rejects a max_model_len beyond the model's own context window
+        context = getattr(AutoConfig.from_pretrained(self.config.model_name), "max_position_embeddings", None)
+        if context:
+            max_model_len = min(max_model_len, context)
+        return max_model_len
+    
+    def _max_new_tokens(self, cap: int, prompt_limit: int) -> int:
+        """Output budget bounded by config and cap, leaving room for a full-length prompt in the context"""
+        budget = min(self.config.max_length, cap)
+        if self.engine is not None:
+            context = self.engine.llm_engine.model_config.max_model_len
+        else:
+            context = getattr(self.model.config, "max_position_embeddings", None)
+        if context:
+            budget = min(budget, context - prompt_limit)
+        return max(budget, 1)
+    
+    def _build_generation_config(self) -> 'GenerationConfig':
+        """Sampling settings for article generation; built once after the tokenizer loads"""
+        # Use more conservative generation settings for better coherence
         return GenerationConfig(
-            max_length=self.config.max_length,
-            temperature=self.config.temperature,
-            top_p=self.config.top_p,
-            top_k=self.config.top_k,
-            repetition_penalty=self.config.repetition_penalty,
+            max_new_tokens=self._max_new_tokens(MAX_NEW_TOKENS, PROMPT_MAX_TOKENS),  # Longer output
+            temperature=0.6,  # Lower temperature for more coherent text
+            top_p=0.8,        # More focused sampling
+            top_k=40,         # Reduced for better quality
+            repetition_penalty=1.15,  # Reduce repetition
             do_sample=True,
             pad_token_id=self.tokenizer.pad_token_id,
             eos_token_id=self.tokenizer.eos_token_id,
-            early_stopping=True
+            no_repeat_ngram_size=3,  # Prevent repetitive phrases
+            use_cache=True,
+            num_return_sequences=1
         )
     
     def generate_article(self, topic: str, category: str, keywords: List[str], 
@@ -339,20 +987,55 @@ class JenosizeTrendGenerator:
         # Clean inputs
         topic = topic.strip()
         category = category.strip()
-        keywords = [k.strip().lower() for k in keywords if k.strip()]
+        keywords = [cleaned for k in keywords if (cleaned := k.strip().lower())]
         target_audience = target_audience.strip()
         tone = tone.strip()
         
         # Check cache first
         cache_key = None
         if self.cache:
-            cache_key = self.cache._get_cache_key(topic, category, keywords, target_audience, tone)
+            # Results from one provider/model (or the mock templates) must not be served for another
+            model_name = self.config.model_name if self.config else ""
+            cache_key = self.cache._get_cache_key(
+                self.provider, model_name, topic, category, keywords, target_audience, tone
+            )
             cached_result = self.cache.get(cache_key)
             if cached_result:
                 logger.info("Returning cached result")
                 return cached_result
+        if self.semantic_cache:
+            cached_result = self.semantic_cache.get(cache_key, topic, category, keywords, target_audience, tone)
+            if cached_result:
+                logger.info("Returning result from shared cache")
+                return cached_result
+        
+        if not cache_key:
+            return self._generate_uncached(topic, category, keywords, target_audience, tone, cache_key)
         
-        # Generate article
+        # Identical concurrent requests share one generation instead of all missing the cache
+        with self.inflight_lock:
+            pending = self.inflight.get(cache_key)
+            if pending is None:
+                future = self.inflight[cache_key] = Future()
+        if pending is not None:
+            logger.info("Waiting for identical in-flight generation")
+            # Callers add their own top-level keys, so each gets its own dict
+            return dict(pending.result())
+        
+        try:
+            result = self._generate_uncached(topic, category, keywords, target_audience, tone, cache_key)
+            future.set_result(result)
+            return dict(result)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self.inflight_lock:
+                del self.inflight[cache_key]
+    
+    def _generate_uncached(self, topic: str, category: str, keywords: List[str], target_audience: str,
+                           tone: str, cache_key: Optional[str]) -> Dict:
+        """Generate, score and cache an article, falling back to the template generator on AI errors"""
         start_time = time.time()
         try:
             if self.use_ai:
@@ -362,7 +1045,7 @@ class JenosizeTrendGenerator:
                 elif self.provider == "openai" and self.openai_handler:
                     logger.info("🚀 Attempting generation with OpenAI API")
                     result = self._generate_with_openai(topic, category, keywords, target_audience, tone)
-                elif self.provider == "huggingface" and self.model and self.tokenizer:
+                elif self.provider == "huggingface" and self.batcher:
                     logger.info("Generating with Hugging Face model")
                     result = self._generate_with_huggingface(topic, category, keywords, target_audience, tone)
                 else:
@@ -391,6 +1074,8 @@ class JenosizeTrendGenerator:
             # Cache result
             if self.cache and cache_key:
                 self.cache.set(cache_key, result)
+                if self.semantic_cache:
+                    self.semantic_cache.set(cache_key, topic, category, keywords, target_audience, tone, result)
             
             # Periodic cleanup
             self.generation_count += 1
@@ -416,163 +1101,9 @@ class JenosizeTrendGenerator:
                                   target_audience: str, tone: str) -> Dict:
         """Generate article using real Jenosize style patterns from scraped content"""
         
-        # Jenosize opening patterns (from actual articles)
-        opening_patterns = {
-            "current_context": [
-                f"In today's digital era, {topic.lower()} has become a critical strategy for brands to stand out.",
-                f"Customer experience is no longer just about providing good service—{topic.lower()} has become the cornerstone of strategy across all sectors.",
-                f"In a time when consumer choices are abundant and attention spans are short, {topic.lower()} has emerged as a powerful tool.",
-                f"In today's data-driven world, {topic.lower()} is key to staying competitive."
-            ],
-            "problem_statement": [
-                f"Traditional approaches are no longer enough to capture consumer interest. Today's businesses need {topic.lower()} that resonates.",
-                f"With cutting-edge technology as a key driver and consumers expecting higher standards, {topic.lower()} is set for a dramatic shift.",
-                f"But have you ever wondered how {topic.lower()} will evolve? The landscape is changing rapidly."
-            ]
-        }
-        
-        # Select appropriate opening based on category
-        if category in ["Futurist", "Technology"]:
-            opening = opening_patterns["current_context"][1]  # Technology focus
-        elif category in ["Marketing", "Experience"]:
-            opening = opening_patterns["current_context"][0]  # Brand strategy focus
-        else:
-            opening = opening_patterns["current_context"][3]  # Data-driven focus
-        
-        # Jenosize content structure patterns
-        def create_what_is_section():
-            return f"""What Is {topic}?
-{topic} is the strategic process of [core definition based on topic]. The goal is to [primary objective], strengthen [key benefit], and drive [desired outcome]. Ultimately, {topic.lower()} aims to [long-term goal].
-
-What does {topic.lower()} involve? It depends on the [context]. Examples include:
-• [Example 1]
-• [Example 2] 
-• [Example 3]
-• [Example 4]
-• [Example 5]"""
-        
-        def create_why_important_section():
-            return f"""Why Is {topic} Important?
-Traditional [old approach] is no longer enough to [achieve goal]. Today's businesses need to create [solution] that resonate. The importance of {topic.lower()} lies in its ability to:
-
-• [Benefit 1]: [Explanation with example]
-• [Benefit 2]: [Explanation with example]  
-• [Benefit 3]: [Explanation with example]
-• [Benefit 4]: [Explanation with example]
-• [Benefit 5]: [Explanation with example]"""
-        
-        def create_tips_trends_section():
-            number = 7 if "tips" in topic.lower() else 9 if "trends" in topic.lower() else 5
-            section_title = f"{number} {topic} {'Trends' if 'trend' in topic.lower() or category == 'Futurist' else 'Tips'}"
-            
-            # Create contextual tips based on keywords and category
-            tip_templates = {
-                "Marketing": [
-                    f"Strategic {keywords[0] if keywords else 'Brand'} Integration",
-                    f"Data-Driven {keywords[1] if len(keywords) > 1 else 'Customer'} Insights", 
-                    f"Omnichannel {keywords[2] if len(keywords) > 2 else 'Experience'} Design",
-                    "Performance Measurement and ROI Tracking",
-                    "Continuous Optimization and A/B Testing"
-                ],
-                "Technology": [
-                    f"Advanced {keywords[0] if keywords else 'AI'} Implementation",
-                    f"Scalable {keywords[1] if len(keywords) > 1 else 'Cloud'} Architecture",
-                    f"Enhanced {keywords[2] if len(keywords) > 2 else 'Security'} Protocols",
-                    "Real-time Analytics and Monitoring",
-                    "Future-proof Integration Planning"
-                ],
-                "default": [
-                    f"Strategic {keywords[0] if keywords else 'Innovation'} Planning",
-                    f"Systematic {keywords[1] if len(keywords) > 1 else 'Implementation'} Approach",
-                    f"Quality {keywords[2] if len(keywords) > 2 else 'Assurance'} Frameworks",
-                    "Performance Metrics and KPI Development",
-                    "Stakeholder Engagement and Communication"
-                ]
-            }
-            
-            tips = tip_templates.get(category, tip_templates["default"])
-            
-            items = []
-            for i, tip in enumerate(tips[:min(number, 5)], 1):
-                quote = f"\"Excellence in {tip.lower()} drives sustainable competitive advantage.\""
-                explanation = f"Organizations implementing comprehensive {tip.lower()} strategies achieve significant improvements in operational efficiency and customer satisfaction. This approach requires systematic planning, dedicated resources, and continuous refinement to deliver measurable business results."
-                items.append(f"""{i}. {tip}
-{quote}
-{explanation}""")
-            
-            return f"""{section_title}
-
-{chr(10).join(items)}"""
-        
-        # Build article content using Jenosize patterns
-        sections = [opening]
-        
-        if "what is" in topic.lower() or category in ["Technology", "Consumer Insights"]:
-            sections.append(create_what_is_section())
-            sections.append(create_why_important_section())
-        elif category == "Futurist" or "trends" in topic.lower():
-            sections.append(create_tips_trends_section())
-        elif category == "Experience" or "tips" in topic.lower():
-            sections.append(create_tips_trends_section())
-        else:
-            sections.append(create_what_is_section())
-            sections.append(create_tips_trends_section())
-        
-        # Jenosize conclusion patterns
-        conclusion_patterns = [
-            f"{topic} is more than [surface level]—it's a strategic communication tool that builds sustainable value.",
-            f"In a world where [context], a well-planned {topic.lower()} strategy can set your brand apart and drive long-term success.",
-            f"{topic} goes far beyond [basic approach]—it's about creating meaningful connections through [key elements].",
-            f"Businesses that want to thrive must begin laying this foundation today to keep pace with fast-changing expectations."
-        ]
-        
-        conclusion = conclusion_patterns[0 if category == "Marketing" else 1 if category == "Experience" else 2]
-        
-        # Add Jenosize call-to-action
-        cta = f"If your organization is seeking expert guidance in {topic.lower()}, Jenosize offers comprehensive solutions tailored to your goals. Contact us today to get started."
-        
-        sections.extend([conclusion, cta])
-        
-        full_content = "\n\n".join(sections)
-        
-        # Clean up placeholders with actual content based on keywords
-        keyword_mapping = {
-            "[core definition based on topic]": f"leveraging {keywords[0] if keywords else 'strategic approaches'} to achieve business objectives",
-            "[primary objective]": f"enhance {keywords[1] if len(keywords) > 1 else 'customer engagement'}",
-            "[key benefit]": f"{keywords[2] if len(keywords) > 2 else 'brand recognition'}",
-            "[desired outcome]": "measurable business results",
-            "[long-term goal]": "develop lasting customer relationships",
-            "[context]": "business objectives and market conditions",
-            "[Example 1]": f"{keywords[0].title() if keywords else 'Strategic'} implementation",
-            "[Example 2]": f"{keywords[1].title() if len(keywords) > 1 else 'Customer'} optimization", 
-            "[Example 3]": f"{keywords[2].title() if len(keywords) > 2 else 'Digital'} transformation",
-            "[Example 4]": "Performance measurement and analysis",
-            "[Example 5]": "Continuous improvement initiatives",
-            "[old approach]": "traditional methods",
-            "[achieve goal]": "meet modern expectations",
-            "[solution]": f"innovative {topic.lower()} strategies",
-            "[Benefit 1]": f"Enhanced {keywords[0] if keywords else 'performance'}",
-            "[Benefit 2]": f"Improved {keywords[1] if len(keywords) > 1 else 'efficiency'}",
-            "[Benefit 3]": f"Greater {keywords[2] if len(keywords) > 2 else 'impact'}",
-            "[Benefit 4]": "Competitive advantage in the market",
-            "[Benefit 5]": "Long-term strategic value creation",
-            "[surface level]": "a simple process",
-            "[basic approach]": "using basic tools",
-            "[key elements]": f"{', '.join(keywords[:3]) if keywords else 'innovation, strategy, and execution'}"
-        }
-        
-        for placeholder, replacement in keyword_mapping.items():
-            full_content = full_content.replace(placeholder, replacement)
-        
-        # Generate realistic title using Jenosize patterns
-        title_patterns = [
-            f"What Is {topic}? {keywords[0].title() if keywords else 'Strategic'} Guide for {target_audience}",
-            f"{len(keywords) + 3} {topic} Trends to Watch in 2030" if category == "Futurist" else f"{len(keywords) + 2} {topic} Tips for Success",
-            f"{topic}: Building Better {keywords[0] if keywords else 'Strategies'} for Modern Business",
-            f"How to Master {topic}: Insights for {target_audience}"
-        ]
-        
-        title = title_patterns[0] if "what is" in topic.lower() else title_patterns[1] if category in ["Futurist", "Experience"] else title_patterns[2]
+        title, full_content, word_count = render_jenosize_article(
+            topic, category, tuple(keywords), target_audience
+        )
         
         return {
             "title": title,
@@ -582,87 +1113,40 @@ Traditional [old approach] is no longer enough to [achieve goal]. Today's busine
                 "keywords": keywords,
                 "target_audience": target_audience,
                 "tone": tone,
-                "word_count": len(full_content.split()),
+                "word_count": word_count,
                 "model": "jenosize_style_generator",
                 "generation_type": "jenosize_trained",
-                "generated_at": datetime.now().isoformat()
+                "generated_at": iso_now()
             }
         }
     
     def _generate_mock_article(self, topic: str, category: str, keywords: List[str], 
                               target_audience: str, tone: str) -> Dict:
         """Generate a comprehensive mock article"""
-        
-        # Create Jenosize-style strategic introduction
-        introduction = f"The convergence of market dynamics and technological innovation in {topic.lower()} is creating unprecedented strategic opportunities for forward-thinking organizations. {target_audience} who understand these emerging trends and act decisively will position their organizations as market leaders in an increasingly competitive landscape, while those who delay risk obsolescence in a rapidly transforming business environment."
+        topic_lower = topic.lower()
         
         # Create sophisticated, industry-specific content sections
         industry_insights = self._generate_industry_insights(topic, category, keywords)
         strategic_framework = self._generate_strategic_framework(topic, keywords, target_audience)
         competitive_analysis = self._generate_competitive_analysis(topic, category)
         
-        main_content = f"""
-## Executive Summary
-
-{topic} represents a transformative force reshaping the competitive landscape of the {category.lower()} sector. Organizations that master these strategic capabilities will capture disproportionate market value, while those that delay implementation face significant competitive disadvantages and potential market displacement.
-
-Current market analysis reveals that early adopters are achieving 25-40% operational improvements and establishing sustainable competitive moats through strategic {keywords[0] if keywords else 'innovation'} initiatives.
-
-{industry_insights}
-
-## Strategic Market Dynamics
-
-The convergence of {keywords[0] if keywords else 'emerging technologies'} and evolving business models is creating unprecedented opportunities for market differentiation. Leading organizations are experiencing:
-
-- **Accelerated Revenue Growth**: Companies implementing comprehensive {keywords[1] if len(keywords) > 1 else 'strategic solutions'} report 30-50% faster revenue growth
-- **Market Valuation Premium**: Public companies with advanced capabilities trade at 20-35% valuation premiums
-- **Customer Loyalty Enhancement**: Organizations achieve 40-60% improvement in customer retention and lifetime value
-- **Operational Excellence**: Industry leaders realize 25-45% efficiency gains through systematic implementation
-
-{competitive_analysis}
-
-{strategic_framework}
-
-## Future Market Evolution
-
-The strategic trajectory of {topic.lower()} indicates accelerating market maturation with increasing competitive differentiation. Organizations establishing leadership positions today will benefit from:
-
-**Network Effects**: Early movers create self-reinforcing advantages through ecosystem development and strategic partnerships that become increasingly difficult for competitors to replicate.
-
-**Regulatory Influence**: Leading organizations shape industry standards and regulatory frameworks, creating favorable competitive conditions for continued market leadership.
-
-**Talent Acquisition**: Market leaders attract top-tier talent and strategic partnerships, further accelerating their competitive advantages and market positioning.
-
-## Executive Action Plan
-
-### Immediate Priorities (0-6 months)
-1. **Strategic Assessment**: Conduct comprehensive evaluation of current capabilities against market leaders
-2. **Investment Authorization**: Secure executive-level commitment and funding for strategic initiatives
-3. **Leadership Alignment**: Ensure C-suite consensus on strategic direction and success metrics
-
-### Medium-term Implementation (6-18 months)
-1. **Capability Development**: Build internal expertise and strategic partnerships
-2. **Pilot Program Launch**: Execute targeted implementations to validate approaches and ROI
-3. **Organizational Transformation**: Adapt structures and processes to support new capabilities
-
-### Long-term Positioning (18+ months)
-1. **Market Leadership**: Establish recognized thought leadership and competitive differentiation
-2. **Ecosystem Development**: Create strategic partnerships and value network advantages
-3. **Continuous Innovation**: Maintain competitive advantages through ongoing capability enhancement
-
-## Strategic Imperatives
-
-The window for establishing market leadership in {topic.lower()} is narrowing rapidly. {target_audience} must act decisively to:
-
-**Secure Competitive Positioning**: Organizations that delay strategic investment risk permanent competitive disadvantage as market leaders establish insurmountable advantages.
-
-**Capture Market Value**: Early movers are capturing disproportionate market value creation, with late adopters facing significantly higher implementation costs and reduced strategic benefits.
-
-**Define Industry Standards**: Leading organizations are shaping the competitive landscape, regulatory environment, and customer expectations in ways that favor their continued market dominance.
-
-The strategic imperative is clear: organizations must commit to comprehensive {topic.lower()} initiatives now or accept subordinate market positions in the transformed competitive landscape."""
-        
-        full_content = f"{introduction}\n\n{main_content}"
+        full_content, word_count = format_with_word_count(MOCK_ARTICLE_TEMPLATE, {
+            "topic": topic,
+            "topic_lower": topic_lower,
+            "category_lower": category.lower(),
+            "target_audience": target_audience,
+            "innovation_keyword": keywords[0] if keywords else 'innovation',
+            "technology_keyword": keywords[0] if keywords else 'emerging technologies',
+            "solutions_keyword": keywords[1] if len(keywords) > 1 else 'strategic solutions',
+            "industry_insights": industry_insights[0],
+            "competitive_analysis": competitive_analysis[0],
+            "strategic_framework": strategic_framework[0]
+        }, {
+            # The sections are the bulk of the article; reuse their counts rather than splitting them
+            "industry_insights": industry_insights[1],
+            "competitive_analysis": competitive_analysis[1],
+            "strategic_framework": strategic_framework[1]
+        })
         
         return {
             "title": f"{topic}: Strategic Imperatives and Competitive Positioning for {target_audience}",
@@ -672,89 +1156,35 @@ The strategic imperative is clear: organizations must commit to comprehensive {t
                 "keywords": keywords,
                 "target_audience": target_audience,
                 "tone": tone,
-                "word_count": len(full_content.split()),
+                "word_count": word_count,
                 "model": "mock_generator_professional",
                 "generation_type": "mock",
-                "generated_at": datetime.now().isoformat()
+                "generated_at": iso_now()
             }
         }
     
-    def _generate_industry_insights(self, topic: str, category: str, keywords: List[str]) -> str:
-        """Generate industry-specific insights based on category"""
-        insights_map = {
-            "Technology": f"## Industry Transformation Indicators\n\nThe technology sector is experiencing fundamental structural changes driven by {keywords[0] if keywords else 'innovation'} adoption. Market research indicates that technology leaders implementing comprehensive strategies achieve 35-50% faster time-to-market and capture 25-40% market share premiums.",
-            
-            "Healthcare": f"## Healthcare Market Evolution\n\nHealthcare organizations leveraging {keywords[0] if keywords else 'digital health'} capabilities are realizing significant improvements in patient outcomes while reducing operational costs by 20-30%. Regulatory frameworks are evolving to support innovation while maintaining safety standards.",
-            
-            "Finance": f"## Financial Services Disruption\n\nThe financial services landscape is undergoing unprecedented transformation through {keywords[0] if keywords else 'fintech'} integration. Leading institutions report 40-60% improvement in customer acquisition costs and 25-35% enhancement in customer lifetime value.",
-            
-            "Manufacturing": f"## Manufacturing Renaissance\n\nManufacturing leaders implementing {keywords[0] if keywords else 'Industry 4.0'} initiatives achieve 30-45% improvement in operational efficiency while reducing quality defects by 50-70%. Supply chain resilience has become a critical competitive differentiator.",
-            
-            "default": f"## Market Transformation Analysis\n\nIndustry analysis reveals that {topic.lower()} is creating new competitive dynamics in the {category.lower()} sector. Organizations with advanced capabilities are establishing market leadership positions through superior customer value delivery."
-        }
-        
-        return insights_map.get(category, insights_map["default"])
+    def _generate_industry_insights(self, topic: str, category: str, keywords: List[str]) -> Tuple[str, int]:
+        """Generate industry-specific insights based on category, with their word count"""
+        template, fallback_keyword = INDUSTRY_INSIGHTS_TEMPLATES.get(category, INDUSTRY_INSIGHTS_TEMPLATES["default"])
+        return format_with_word_count(template, {
+            "keyword": keywords[0] if keywords else fallback_keyword,
+            "topic_lower": topic.lower(),
+            "category_lower": category.lower()
+        })
     
-    def _generate_strategic_framework(self, topic: str, keywords: List[str], target_audience: str) -> str:
-        """Generate strategic implementation framework"""
+    def _generate_strategic_framework(self, topic: str, keywords: List[str], target_audience: str) -> Tuple[str, int]:
+        """Generate strategic implementation framework, with its word count"""
         primary_keyword = keywords[0] if keywords else 'strategic initiatives'
         
-        return f"""## Strategic Implementation Framework
-
-### Capability Assessment Matrix
-{target_audience} must evaluate organizational readiness across four critical dimensions:
-
-**Technology Infrastructure**: Current systems' ability to support {primary_keyword} integration and scale requirements for future growth and competitive positioning.
-
-**Organizational Capabilities**: Workforce skills, leadership commitment, and change management capacity to execute comprehensive transformation initiatives successfully.
-
-**Market Positioning**: Competitive landscape analysis and strategic positioning requirements to capture market opportunities and defend against competitive threats.
-
-**Financial Resources**: Investment capacity and ROI expectations for {topic.lower()} initiatives, including both direct costs and opportunity costs of delayed implementation.
-
-### Implementation Methodology
-
-**Phase 1 - Strategic Foundation (Months 1-6)**
-- Executive alignment on strategic objectives and success metrics
-- Comprehensive capability assessment and gap analysis
-- Resource allocation and organizational structure optimization
-- Initial pilot program design and launch preparation
-
-**Phase 2 - Tactical Execution (Months 6-18)**  
-- Core capability development and technology integration
-- Workforce development and change management implementation
-- Performance measurement and continuous improvement processes
-- Strategic partnership development and ecosystem creation
-
-**Phase 3 - Market Leadership (Months 18+)**
-- Competitive differentiation and market positioning
-- Advanced capability development and innovation leadership
-- Ecosystem expansion and strategic alliance management
-- Continuous evolution and competitive advantage maintenance"""
+        return format_with_word_count(STRATEGIC_FRAMEWORK_TEMPLATE, {
+            "target_audience": target_audience,
+            "primary_keyword": primary_keyword,
+            "topic_lower": topic.lower()
+        })
     
-    def _generate_competitive_analysis(self, topic: str, category: str) -> str:
-        """Generate competitive landscape analysis"""
-        return f"""## Competitive Landscape Analysis
-
-### Market Leader Characteristics
-Organizations achieving market leadership in {topic.lower()} demonstrate consistent patterns across strategic, operational, and cultural dimensions:
-
-**Strategic Vision**: Clear articulation of {topic.lower()} as core competitive advantage with executive-level commitment and sustained investment over 3-5 year horizons.
-
-**Execution Excellence**: Systematic implementation methodologies with rigorous performance measurement and continuous improvement processes that deliver measurable business outcomes.
-
-**Innovation Culture**: Organizational cultures that embrace experimentation, learning, and adaptation while maintaining operational discipline and customer focus.
-
-### Competitive Differentiation Strategies
-Market leaders create sustainable advantages through:
-
-- **Ecosystem Development**: Building strategic partnerships and value networks that create barriers to competitive entry
-- **Customer Experience Excellence**: Delivering superior customer value through integrated solutions and seamless experiences  
-- **Operational Efficiency**: Achieving cost structures and operational capabilities that enable competitive pricing and superior margins
-- **Innovation Leadership**: Continuous capability enhancement and market-leading product development that sets industry standards
-
-### Market Dynamics Impact
-The competitive implications of {topic.lower()} extend beyond direct operational benefits to fundamental market structure changes that favor prepared organizations over reactive competitors."""
+    def _generate_competitive_analysis(self, topic: str, category: str) -> Tuple[str, int]:
+        """Generate competitive landscape analysis, with its word count"""
+        return format_with_word_count(COMPETITIVE_ANALYSIS_TEMPLATE, {"topic_lower": topic.lower()})
     
     def _generate_with_claude(self, topic: str, category: str, keywords: List[str], 
                              target_audience: str, tone: str) -> Dict:
@@ -790,7 +1220,7 @@ The competitive implications of {topic.lower()} extend beyond direct operational
                     "word_count": len(article_content.split()),
                     "model": self.config.model_name,
                     "provider": "claude",
-                    "generated_at": datetime.now().isoformat(),
+                    "generated_at": iso_now(),
                     "generation_type": "ai_claude",
                     "input_tokens": response.usage.input_tokens if response.usage else None,
                     "output_tokens": response.usage.output_tokens if response.usage else None
@@ -845,7 +1275,7 @@ The competitive implications of {topic.lower()} extend beyond direct operational
                     "word_count": len(article_content.split()),
                     "model": self.config.model_name,
                     "provider": "openai",
-                    "generated_at": datetime.now().isoformat(),
+                    "generated_at": iso_now(),
                     "generation_type": "ai_openai",
                     "tokens_used": response.usage.total_tokens if response.usage else None
                 }
@@ -870,35 +1300,9 @@ The competitive implications of {topic.lower()} extend beyond direct operational
             # Create optimized prompt for HuggingFace
             prompt = self._create_huggingface_prompt(topic, category, keywords, target_audience, tone)
             
-            # Tokenize with optimized parameters
-            inputs = self.tokenizer(
-                prompt,
-                return_tensors="pt",
-                truncation=True,
-                max_length=min(800, self.config.max_length),  # More room for comprehensive content
-                padding=False
-            ).to(self.device)
-            
-            # Use more conservative generation settings for better coherence
-            with torch.no_grad():
-                outputs = self.model.generate(
-                    **inputs,
-                    max_length=min(self.config.max_length, 1200),  # Longer output
-                    temperature=0.6,  # Lower temperature for more coherent text
-                    top_p=0.8,        # More focused sampling
-                    top_k=40,         # Reduced for better quality
-                    repetition_penalty=1.15,  # Reduce repetition
-                    do_sample=True,
-                    pad_token_id=self.tokenizer.pad_token_id,
-                    eos_token_id=self.tokenizer.eos_token_id,
-                    no_repeat_ngram_size=3,  # Prevent repetitive phrases
-                    use_cache=True,
-                    num_return_sequences=1
-                )
-            
-            # Decode and clean
-            generated_text = self.tokenizer.decode(outputs[0], skip_special_tokens=True)
-            article_content = self._extract_and_clean_hf_content(generated_text, prompt)
+            # Generate alongside any concurrent requests, then clean
+            generated_text = self.batcher.submit(prompt)
+            article_content = self._extract_and_clean_hf_content(generated_text)
             
             # Post-process content for quality
             article_content = self._enhance_content_quality(article_content, topic, keywords)
@@ -917,7 +1321,7 @@ The competitive implications of {topic.lower()} extend beyond direct operational
                     "word_count": len(article_content.split()),
                     "model": self.config.model_name,
                     "device": str(self.device),
-                    "generated_at": datetime.now().isoformat(),
+                    "generated_at": iso_now(),
                     "generation_type": "ai"
                 }
             }
@@ -931,10 +1335,52 @@ The competitive implications of {topic.lower()} extend beyond direct operational
             logger.error(f"AI generation failed: {e}")
             raise
     
+    def _generate_batch(self, prompts: List[str]) -> List[str]:
+        """Run one generate() call for a batch of prompts and decode each completion"""
+        # Tokenize with optimized parameters
+        inputs = self.tokenizer(
+            prompts,
+            return_tensors="pt",
+            truncation=True,
+            max_length=PROMPT_MAX_TOKENS,
+            padding=True,
+            # Bucket prompt widths on GPU so the compiled forward sees fewer distinct shapes
+            pad_to_multiple_of=PROMPT_PAD_MULTIPLE if self.device.type == "cuda" else None
+        ).to(self.device)
+        
+        with torch.inference_mode():
+            outputs = self.model.generate(**inputs, generation_config=self.generation_config)
+        
+        # Prompts are left-padded to a common width, so completions start at the same column
+        input_len = inputs["input_ids"].shape[1]
+        return self.tokenizer.batch_decode(outputs[:, input_len:], skip_special_tokens=True)
+    
+    def _sampling_params(self, max_new_tokens: int, prompt_limit: int, **overrides) -> 'SamplingParams':
+        """vLLM sampling settings matching the transformers generation config"""
+        params = {
+            "temperature": 0.6,
+            "top_p": 0.8,
+            "top_k": 40,
+            "repetition_penalty": 1.15,
+            "max_tokens": max_new_tokens,
+            "truncate_prompt_tokens": prompt_limit
+        }
+        params.update(overrides)
+        return SamplingParams(**params)
+    
+    def _generate_batch_vllm(self, prompts: List[str]) -> List[str]:
+        """Run a batch through the vLLM engine and return each completion"""
+        sampling_params = self._sampling_params(
+            self._max_new_tokens(MAX_NEW_TOKENS, PROMPT_MAX_TOKENS), PROMPT_MAX_TOKENS
+        )
+        outputs = self.engine.generate(prompts, sampling_params, use_tqdm=False)
+        return [output.outputs[0].text for output in outputs]
+    
     def _create_huggingface_prompt(self, topic: str, category: str, keywords: List[str], 
                                   target_audience: str, tone: str) -> str:
         """Create an optimized prompt for HuggingFace models with better structure"""
         keywords_str = ", ".join(keywords[:3])  # Fewer keywords for better focus
+        topic_lower = topic.lower()
         
         # Create a more structured prompt that guides the model better
         prompt = f"""Business Article: {topic}
@@ -950,21 +1396,20 @@ Current Market Analysis: Leading companies are transforming their operations thr
 
 Strategic Implementation Framework: Successful organizations follow a comprehensive approach that encompasses:
 
-1. Strategic Planning: Develop clear roadmap aligning {topic.lower()} initiatives with business objectives
+1. Strategic Planning: Develop clear roadmap aligning {topic_lower} initiatives with business objectives
 2. Technology Integration: Implement scalable solutions that enhance operational capabilities
 3. Change Management: Ensure workforce adaptation and skill development
 4. Performance Measurement: Establish metrics for continuous improvement
 
-Future Market Outlook: The trajectory of {topic.lower()} suggests continued evolution and strategic importance. Organizations establishing strong foundations today will be positioned for long-term success.
+Future Market Outlook: The trajectory of {topic_lower} suggests continued evolution and strategic importance. Organizations establishing strong foundations today will be positioned for long-term success.
 
 Key recommendations include systematic evaluation of current capabilities, strategic investment in core technologies, and development of adaptive organizational structures that support ongoing innovation and market responsiveness."""
         
         return prompt
     
-    def _extract_and_clean_hf_content(self, generated_text: str, prompt: str) -> str:
+    def _extract_and_clean_hf_content(self, generated_text: str) -> str:
         """Extract and clean HuggingFace generated content with quality enhancements"""
-        # Remove the original prompt
-        content = generated_text.replace(prompt, "").strip()
+        content = generated_text.strip()
         
         # Clean up common issues - fix literal newlines
         content = content.replace("\\\\n\\\\n\\\\n", "\n\n")
@@ -994,22 +1439,9 @@ Key recommendations include systematic evaluation of current capabilities, strat
             if len(paragraph.split()) < 10:
                 continue
                 
-            # Enhance paragraph with professional language
-            enhanced = paragraph
-            
             # Replace casual language with business language
-            replacements = {
-                'things': 'initiatives',
-                'stuff': 'solutions',
-                'really': 'significantly',
-                'very': 'highly',
-                'good': 'effective',
-                'bad': 'suboptimal',
-                'big': 'substantial',
-                'small': 'targeted'
-            }
-            
-            for casual, professional in replacements.items():
+            enhanced = paragraph
+            for casual, professional in CASUAL_LANGUAGE_REPLACEMENTS.items():
                 enhanced = enhanced.replace(f' {casual} ', f' {professional} ')
             
             enhanced_paragraphs.append(enhanced)
@@ -1017,11 +1449,13 @@ Key recommendations include systematic evaluation of current capabilities, strat
         # Rejoin paragraphs
         result = '\\n\\n'.join(enhanced_paragraphs)
         
-        # Ensure strategic language is present
-        if 'strategic' not in result.lower():
+        # Ensure strategic language is present; the first swap can't change
+        # whether 'competitive'/'advantage' appear, so one lowercase copy serves both checks
+        result_lower = result.lower()
+        if 'strategic' not in result_lower:
             result = result.replace('important', 'strategic')
         
-        if 'competitive' not in result.lower() and 'advantage' in result.lower():
+        if 'competitive' not in result_lower and 'advantage' in result_lower:
             result = result.replace('advantage', 'competitive advantage')
             
         return result
@@ -1042,26 +1476,8 @@ Key recommendations include systematic evaluation of current capabilities, strat
     
     def _generate_ai_title(self, topic: str, category: str, tone: str) -> str:
         """Generate an engaging title based on content"""
-        title_templates = {
-            "Professional": [
-                f"{topic}: Strategic Market Analysis and Implementation Guide",
-                f"Navigating {topic} in Modern {category}",
-                f"{topic}: Business Impact and Strategic Opportunities"
-            ],
-            "Technical": [
-                f"{topic}: Technical Deep Dive and Best Practices",
-                f"Engineering {topic} Solutions for {category}",
-                f"{topic}: Architecture and Implementation Strategies"
-            ],
-            "Inspirational": [
-                f"Transforming Business with {topic}",
-                f"The Future of {category}: {topic} Revolution",
-                f"Unlocking Potential: {topic} Success Stories"
-            ]
-        }
-        
-        templates = title_templates.get(tone, title_templates["Professional"])
-        return templates[hash(topic) % len(templates)]
+        templates = AI_TITLE_TEMPLATES.get(tone, AI_TITLE_TEMPLATES["Professional"])
+        return templates[hash(topic) % len(templates)].format(topic=topic, category=category)
     
     def _create_openai_prompt(self, topic: str, category: str, keywords: List[str], 
                              target_audience: str, tone: str) -> str:
@@ -1163,10 +1579,11 @@ Write as if this article will be read by CEOs making million-dollar strategic de
     
     def _extract_title_from_content(self, content: str, fallback_topic: str) -> str:
         """Extract title from OpenAI generated content or create one"""
-        lines = content.strip().split('\n')
+        # Only the first 5 lines are candidates, so don't split the whole article
+        lines = content.strip().split('\n', 5)[:5]
         
         # Look for the first line that looks like a title (usually starts with #)
-        for line in lines[:5]:  # Check first 5 lines
+        for line in lines:
             line = line.strip()
             if line.startswith('#'):
                 # Remove markdown formatting
@@ -1188,27 +1605,15 @@ Write as if this article will be read by CEOs making million-dollar strategic de
         # Create shorter prompt
         prompt = f"Business article: {topic} in {category}. Keywords: {', '.join(keywords[:3])}\\n\\nArticle:\\n\\n"
         
-        inputs = self.tokenizer(
-            prompt,
-            return_tensors="pt",
-            truncation=True,
-            max_length=256,
-            padding=False
-        ).to(self.device)
-        
-        with torch.no_grad():
-            outputs = self.model.generate(
-                **inputs,
-                max_length=min(self.config.max_length, 512),
-                temperature=0.7,  # Slightly lower
-                top_p=0.8,
-                do_sample=True,
-                pad_token_id=self.tokenizer.pad_token_id,
-                eos_token_id=self.tokenizer.eos_token_id
+        if self.engine is not None:
+            sampling_params = self._sampling_params(
+                self._max_new_tokens(REDUCED_MAX_NEW_TOKENS, REDUCED_PROMPT_MAX_TOKENS), REDUCED_PROMPT_MAX_TOKENS,
+                temperature=0.7, top_k=-1, repetition_penalty=1.0
             )
-        
-        generated_text = self.tokenizer.decode(outputs[0], skip_special_tokens=True)
-        article_content = generated_text.replace(prompt, "").strip()
+            output = self.engine.generate([prompt], sampling_params, use_tqdm=False)[0]
+            article_content = output.outputs[0].text.strip()
+        else:
+            article_content = self._generate_reduced_with_transformers(prompt)
         
         return {
             "title": f"{topic}: Analysis and Insights",
@@ -1221,16 +1626,43 @@ Write as if this article will be read by CEOs making million-dollar strategic de
                 "word_count": len(article_content.split()),
                 "model": f"{self.config.model_name} (reduced params)",
                 "device": str(self.device),
-                "generated_at": datetime.now().isoformat(),
+                "generated_at": iso_now(),
                 "generation_type": "ai_reduced"
             }
         }
     
+    def _generate_reduced_with_transformers(self, prompt: str) -> str:
+        """Reduced-parameter generate() on the transformers model"""
+        inputs = self.tokenizer(
+            prompt,
+            return_tensors="pt",
+            truncation=True,
+            max_length=REDUCED_PROMPT_MAX_TOKENS,
+            padding=False
+        ).to(self.device)
+        
+        input_len = inputs["input_ids"].shape[1]
+        
+        with torch.inference_mode():
+            outputs = self.model.generate(
+                **inputs,
+                max_new_tokens=self._max_new_tokens(REDUCED_MAX_NEW_TOKENS, REDUCED_PROMPT_MAX_TOKENS),
+                temperature=0.7,  # Slightly lower
+                top_p=0.8,
+                do_sample=True,
+                use_cache=True,
+                pad_token_id=self.tokenizer.pad_token_id,
+                eos_token_id=self.tokenizer.eos_token_id
+            )
+        
+        # Decode only the new tokens rather than stripping the prompt back out
+        return self.tokenizer.decode(outputs[0, input_len:], skip_special_tokens=True).strip()
+    
     def get_model_info(self) -> Dict:
         """Get information about the current model setup"""
         info = {
             "ai_available": self.use_ai,
-            "model_loaded": self.model is not None,
+            "model_loaded": self.model is not None or self.engine is not None,
             "device": str(self.device) if self.device else None,
             "cache_enabled": self.enable_caching,
             "generation_count": self.generation_count
@@ -1249,13 +1681,12 @@ Write as if this article will be read by CEOs making million-dollar strategic de
     def clear_cache(self) -> None:
         """Clear all caches"""
         if self.cache:
-            with self.cache.cache_lock:
-                self.cache.cache.clear()
-                self.cache.cache_times.clear()
+            self.cache.clear()
             logger.info("Cache cleared")
+        if self.semantic_cache:
+            self.semantic_cache.clear()
         
-        if hasattr(self, '_get_generation_config'):
-            self._get_generation_config.cache_clear()
+        render_jenosize_article.cache_clear()
     
     def __del__(self):
         """Cleanup on destruction"""
@@ -0,0 +1,145 @@
+"""Redis-backed article cache shared across workers that also serves near-duplicate requests"""
+import logging
+import os
+import time
+from typing import Dict, List, Optional
+
+import orjson
+
+logger = logging.getLogger(__name__)
+
+try:
+    import numpy as np
+    import redis
+    from sentence_transformers import SentenceTransformer
+    SEMANTIC_CACHE_AVAILABLE = True
+except ImportError:
+    SEMANTIC_CACHE_AVAILABLE = False
+
+# Cosine distance under which two requests count as the same article
+DEFAULT_MAX_DISTANCE = 0.15
+EMBEDDING_MODEL = "all-MiniLM-L6-v2"
+# Most recent vectors kept per (category, audience, tone); bounds each lookup's scan
+MAX_VECTORS_PER_SCOPE = 512
+
+
+class SemanticCache:
+    """Cache generated articles in Redis by exact key, falling back to embedding similarity"""
+
+    def __init__(self, redis_url: str, encoder: "SentenceTransformer", namespace: str = "jenosize:articles",
+                 max_distance: float = DEFAULT_MAX_DISTANCE, ttl_s: int = 24 * 60 * 60):
+        self.redis = redis.Redis.from_url(redis_url)
+        self.encoder = encoder
+        self.namespace = namespace
+        self.min_similarity = 1.0 - max_distance
+        self.ttl_s = ttl_s
+
+    @classmethod
+    def from_env(cls, encoder: Optional["SentenceTransformer"] = None,
+                 namespace: str = "jenosize:articles") -> Optional["SemanticCache"]:
+        """Build a cache from REDIS_URL, or return None when it is unset or unusable
+        
+        Pass the style matcher's all-MiniLM-L6-v2 encoder to avoid loading a second copy.
+        """
+        redis_url = os.getenv("REDIS_URL")
+        if not redis_url:
+            return None
+        if not SEMANTIC_CACHE_AVAILABLE:
+            logger.warning("REDIS_URL is set but redis/sentence-transformers are not installed")
+            return None
+        try:
+            cache = cls(redis_url, encoder or SentenceTransformer(EMBEDDING_MODEL), namespace)
+            cache.redis.ping()
+            logger.info("Semantic article cache connected to Redis")
+            return cache
+        except Exception as e:
+            logger.warning(f"Semantic cache disabled: {e}")
+            return None
+
+    def _vectors_key(self, category: str, target_audience: str, tone: str) -> str:
+        """Hash of embeddings for one (category, audience, tone); only topic + keywords are fuzzy"""
+        return f"{self.namespace}:vectors:{category.lower()}|{target_audience.lower()}|{tone.lower()}"
+    
+    def _index_key(self, vectors_key: str) -> str:
+        """Sorted set of vector ids by write time, used to expire and cap the vectors hash"""
+        return f"{vectors_key}:index"
+
+    def _embed(self, topic: str, keywords: List[str]) -> "np.ndarray":
+        """Normalized float32 embedding of the topic and sorted keywords"""
+        text = f"{topic.lower()} | {', '.join(sorted(keywords))}"
+        return self.encoder.encode(text, normalize_embeddings=True).astype(np.float32)
+
+    def get(self, key: str, topic: str, category: str, keywords: List[str],
+            target_audience: str, tone: str) -> Optional[Dict]:
+        """Return the article cached under key, else the closest one within the distance threshold"""
+        try:
+            # Exact hits skip the embedding entirely
+            cached = self.redis.get(f"{self.namespace}:doc:{key}")
+            if cached is not None:
+                return orjson.loads(cached)["article"]
+            entries = self.redis.hgetall(self._vectors_key(category, target_audience, tone))
+            if not entries:
+                return None
+            query = self._embed(topic, keywords)
+            ids = list(entries)
+            matrix = np.frombuffer(b"".join(entries[i] for i in ids), dtype=np.float32).reshape(len(ids), -1)
+            scores = matrix @ query
+            best = int(scores.argmax())
+            if scores[best] < self.min_similarity:
+                return None
+            cached = self.redis.get(f"{self.namespace}:doc:{ids[best].decode()}")
+            if cached is None:
+                # Document expired; drop its vector so it stops matching
+                vectors_key = self._vectors_key(category, target_audience, tone)
+                self.redis.hdel(vectors_key, ids[best])
+                self.redis.zrem(self._index_key(vectors_key), ids[best])
+                return None
+            # The article was written for a similar request; its metadata stays as generated,
+            # and the request it was generated for is reported alongside
+            doc = orjson.loads(cached)
+            result = doc["article"]
+            metadata = result.setdefault("metadata", {})
+            metadata["semantic_cache_hit"] = True
+            metadata["semantic_cache_source"] = doc["source"]
+            return result
+        except Exception as e:
+            logger.warning(f"Semantic cache lookup failed: {e}")
+            return None
+
+    def set(self, key: str, topic: str, category: str, keywords: List[str],
+            target_audience: str, tone: str, value: Dict) -> None:
+        """Store an article under key and index its embedding for similarity lookups"""
+        try:
+            vector = self._embed(topic, keywords)
+            vectors_key = self._vectors_key(category, target_audience, tone)
+            index_key = self._index_key(vectors_key)
+            now = time.time()
+            with self.redis.pipeline() as pipe:
+                doc = {"article": value, "source": {"topic": topic, "keywords": keywords}}
+                pipe.set(f"{self.namespace}:doc:{key}", orjson.dumps(doc, default=str), ex=self.ttl_s)
+                pipe.hset(vectors_key, key, vector.tobytes())
+                pipe.zadd(index_key, {key: now})
+                # An idle scope disappears with its last document
+                pipe.expire(vectors_key, self.ttl_s)
+                pipe.expire(index_key, self.ttl_s)
+                pipe.execute()
+            
+            # Drop vectors whose documents have expired, then all but the newest MAX_VECTORS_PER_SCOPE
+            stale = set(self.redis.zrangebyscore(index_key, "-inf", now - self.ttl_s))
+            stale.update(self.redis.zrange(index_key, 0, -(MAX_VECTORS_PER_SCOPE + 1)))
+            if stale:
+                with self.redis.pipeline() as pipe:
+                    pipe.hdel(vectors_key, *stale)
+                    pipe.zrem(index_key, *stale)
+                    pipe.execute()
+        except Exception as e:
+            logger.warning(f"Semantic cache write failed: {e}")
+
+    def clear(self) -> None:
+        """Delete every key in this cache's namespace"""
+        try:
+            keys = list(self.redis.scan_iter(f"{self.namespace}:*", count=500))
+            if keys:
+                self.redis.delete(*keys)
+        except Exception as e:
+            logger.warning(f"Semantic cache clear failed: {e}")
@@ -0,0 +1,17 @@
+"""Cheap ISO-8601 timestamps for response metadata"""
+import time
+from datetime import datetime
+
+# (epoch second, ISO string) for the most recently formatted second
+_iso_cache = (0, "")
+
+
+def iso_now() -> str:
+    """Current local time as an ISO-8601 string, formatted at most once per second"""
+    global _iso_cache
+    now = int(time.time())
+    cached = _iso_cache
+    if cached[0] != now:
+        cached = (now, datetime.fromtimestamp(now).isoformat())
+        _iso_cache = cached
+    return cached[1]
@@ -10,11 +10,11 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from typing import Dict, List, Optional
 import logging
-from datetime import datetime
 from .article_processor import JenosizeArticleStyleMatcher
 from .style_prompt_generator import JenosizeStylePromptGenerator
 from model.generator import JenosizeTrendGenerator
 from model.config import ModelConfig
+from model.timestamps import iso_now
 
 logger = logging.getLogger(__name__)
 
@@ -34,7 +34,8 @@ class StyleAwareContentGenerator:
         
         # Initialize content generator with existing system
         self.config = config or ModelConfig()
-        self.content_generator = JenosizeTrendGenerator(self.config)
+        # Share the style matcher's embedding model with the semantic cache
+        self.content_generator = JenosizeTrendGenerator(self.config, encoder=self.style_matcher.model)
         
         # Track if style system is ready
         self.style_ready = False
@@ -455,7 +456,7 @@ class StyleAwareContentGenerator:
                 'word_count': word_count,
                 'model': model_used,
                 'quality_score': quality_score,
-                'generated_at': datetime.now().isoformat()
+                'generated_at': iso_now()
             }
         }
     
@@ -465,7 +466,8 @@ class StyleAwareContentGenerator:
         
         # Keyword inclusion
         if keywords:
-            keyword_mentions = sum(1 for keyword in keywords if keyword.lower() in content.lower())
+            content_lower = content.lower()
+            keyword_mentions = sum(1 for keyword in keywords if keyword.lower() in content_lower)
             keyword_score = min(keyword_mentions / len(keywords), 1.0) * 0.2
             score += keyword_score
         
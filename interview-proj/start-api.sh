@@ -3,5 +3,6 @@
 # Production startup script for FastAPI on Render
 export PYTHONPATH="/opt/render/project/src:$PYTHONPATH"
 
-# Start the FastAPI application
-exec uvicorn src.api.main:app --host 0.0.0.0 --port ${PORT:-8000}
\ No newline at end of file
+# Start the FastAPI application; worker count, uvloop and httptools are
+# configured in src/api/main.py so this and the Docker image share one policy
+exec python -m src.api.main